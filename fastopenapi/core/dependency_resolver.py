@@ -1,7 +1,8 @@
 import inspect
 import threading
 from collections.abc import Callable
-from contextlib import contextmanager
+from dataclasses import dataclass, field
+from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR
 from typing import Any
 from weakref import WeakKeyDictionary
 
@@ -13,6 +14,93 @@ from fastopenapi.errors.exceptions import (
     DependencyError,
 )
 
+# Sentinel distinguishing a cache miss from a cached ``None``
+_MISSING = object()
+
+_KIND_FLAGS = CO_COROUTINE | CO_GENERATOR | CO_ASYNC_GENERATOR
+
+
+def _get_dependency_kind(func: Callable) -> int:
+    """
+    Classify a dependency function by its code flags
+
+    Returns CO_COROUTINE, CO_GENERATOR, CO_ASYNC_GENERATOR or 0 for plain
+    callables. Objects without ``__code__`` (partials, callable instances,
+    classes) fall back to the slower inspect predicates.
+    """
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        return code.co_flags & _KIND_FLAGS
+    if inspect.isasyncgenfunction(func):
+        return CO_ASYNC_GENERATOR
+    if inspect.isgeneratorfunction(func):
+        return CO_GENERATOR
+    if inspect.iscoroutinefunction(func):
+        return CO_COROUTINE
+    return 0
+
+
+class _CallableCache:
+    """
+    Mapping keyed by callables that doesn't keep them alive
+
+    Entries disappear together with their callable. Callables that can't be
+    weakly referenced (e.g. instances of slotted classes) are held strongly.
+    """
+
+    __slots__ = ("_weak", "_strong")
+
+    def __init__(self):
+        self._weak: WeakKeyDictionary[Callable, Any] = WeakKeyDictionary()
+        self._strong: dict[Callable, Any] = {}
+
+    def get(self, key: Callable, default: Any = None) -> Any:
+        try:
+            return self._weak.get(key, default)
+        except TypeError:
+            return self._strong.get(key, default)
+
+    def __getitem__(self, key: Callable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Callable, value: Any) -> None:
+        try:
+            self._weak[key] = value
+        except TypeError:
+            self._strong[key] = value
+
+    def __contains__(self, key: Callable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._weak) + len(self._strong)
+
+
+@dataclass(slots=True, frozen=True)
+class DependencyNode:
+    """Precompiled resolution step for one Depends/Security parameter"""
+
+    name: str
+    dependency: Depends | Security
+    func: Callable
+    # Scopes injected into the dependency, None for plain Depends
+    security_scopes: SecurityScopes | None = None
+    # Dependency function takes no parameters: nothing to resolve or recurse into
+    is_leaf: bool = False
+    # Call convention from _get_dependency_kind, fixed per function
+    kind: int = 0
+
+
+@dataclass(slots=True)
+class _RequestState:
+    """Per-request resolution state passed down the dependency recursion"""
+
+    resolved: dict[Callable, Any] = field(default_factory=dict)
+    generators: list = field(default_factory=list)
+
 
 class DependencyResolver:
     """
@@ -25,17 +113,26 @@ class DependencyResolver:
     - Async and sync execution modes
     """
 
+    # ParameterResolver, imported on first use: its module imports this one
+    _parameter_resolver: type | None = None
+
     def __init__(self):
-        # Request-scoped cache (cleared per request)
-        self._request_cache = WeakKeyDictionary()
-        self._request_cache_lock = threading.RLock()
+        # Active request states keyed by id(request_data), cleared per request.
+        # Only consulted on entry; the recursion receives the state directly
+        self._request_cache: dict[int, _RequestState] = {}
+        self._request_cache_lock = threading.Lock()
 
         # Execution locks per dependency function to prevent race conditions
         self._execution_locks_lock = threading.Lock()
-        self._execution_locks: dict[int, threading.Lock] = {}
+        self._execution_locks = _CallableCache()
 
+        # Per-function caches, released together with the function
         # Dependency signature cache
-        self._signature_cache: dict[Callable, dict] = {}
+        self._signature_cache = _CallableCache()
+        # SecurityScopes and regular parameter names per dependency function
+        self._params_cache = _CallableCache()
+        # Dependency plan cache for endpoints and dependency functions
+        self._plan_cache = _CallableCache()
 
     def resolve_dependencies(
         self,
@@ -52,168 +149,93 @@ class DependencyResolver:
         Returns:
             Dict mapping parameter names to resolved dependency values
         """
+        # Endpoints without dependencies need no request-scoped tracking
+        if not self.compile_plan(endpoint):
+            return {}
+
         # Initialize request-scoped tracking
+        request_id = id(request_data)
         is_top_level = False
         with self._request_cache_lock:
-            if request_data not in self._request_cache:
+            state = self._request_cache.get(request_id)
+            if state is None:
                 is_top_level = True
-                self._request_cache[request_data] = {
-                    "resolved": {},
-                    "resolving": set(),
-                    "generators": [],
-                }
+                state = self._request_cache[request_id] = _RequestState()
 
         try:
-            return self._resolve_endpoint_dependencies(endpoint, request_data)
+            return self._resolve_endpoint_dependencies(endpoint, request_data, state)
         finally:
             if is_top_level:
-                # Get generators before deleting cache
                 with self._request_cache_lock:
-                    cache = self._request_cache.get(request_data, {})
-                    generators = list(cache.get("generators", []))
+                    self._request_cache.pop(request_id, None)
                 # Close generators (triggers finally blocks)
-                for gen in generators:
+                for gen in state.generators:
                     try:
                         gen.close()
                     except Exception:
                         pass
-                # Clean up request cache
-                with self._request_cache_lock:
-                    if request_data in self._request_cache:
-                        del self._request_cache[request_data]
 
     def _resolve_endpoint_dependencies(
-        self, endpoint: Callable, request_data: RequestData
+        self, endpoint: Callable, request_data: RequestData, state: _RequestState
     ) -> dict[str, Any]:
         """Resolve dependencies for a specific endpoint"""
         dependencies = {}
-        sig = self._get_signature(endpoint)
-
-        for param_name, param in sig.items():
-            if isinstance(param.default, (Depends, Security)):
-                try:
-                    value = self._resolve_single_dependency(
-                        param.default, request_data, param_name, param.annotation
-                    )
-                    dependencies[param_name] = value
-                except (DependencyError, APIError) as e:
-                    raise e
-                except Exception as e:
-                    raise DependencyError(
-                        f"Failed to resolve dependency '{param_name}'"
-                    ) from e
-
-        return dependencies
-
-    def _resolve_single_dependency(
-        self,
-        dependency: Depends | Security,
-        request_data: RequestData,
-        param_name: str = None,
-        param_annotation: type = None,
-    ) -> Any:
-        """
-        Resolve a single dependency with caching and recursion
-
-        Args:
-            dependency: Depends or Security instance
-            request_data: Request data container
-            param_name: Parameter name for error reporting
-            param_annotation: Expected return type annotation
-
-        Returns:
-            Resolved dependency value
-        """
-        # Get the dependency function
-        dependency_func = self._get_dependency_func(
-            dependency, param_name, param_annotation
-        )
+        plan = self.compile_plan(endpoint)
 
-        # Handle Security-specific logic
-        if isinstance(dependency, Security):
-            return self._resolve_security_dependency(
-                dependency, dependency_func, request_data, param_name
+        # Failures are raised as DependencyError/APIError where they occur
+        for node in plan:
+            dependencies[node.name] = self._execute_dependency_function(
+                node, request_data, state
             )
 
-        # Handle regular Depends
-        return self._resolve_regular_dependency(
-            dependency_func, request_data, param_name
-        )
-
-    def _resolve_security_dependency(
-        self,
-        security: Security,
-        dependency_func: Callable,
-        request_data: RequestData,
-        param_name: str,
-    ) -> Any:
-        """Resolve Security dependency, injecting SecurityScopes if requested"""
-        return self._execute_dependency_function(
-            dependency_func,
-            request_data,
-            param_name,
-            security_scopes=SecurityScopes(security.scopes),
-        )
-
-    def _resolve_regular_dependency(
-        self,
-        dependency_func: Callable,
-        request_data: RequestData,
-        param_name: str,
-    ) -> Any:
-        """Resolve regular Depends dependency"""
-        return self._execute_dependency_function(
-            dependency_func, request_data, param_name
-        )
+        return dependencies
 
     def _execute_dependency_function(
         self,
-        dependency_func: Callable,
+        node: DependencyNode,
         request_data: RequestData,
-        param_name: str,
-        security_scopes: SecurityScopes | None = None,
+        state: _RequestState,
     ) -> Any:
         """
         Execute dependency function with caching and circular dependency detection
-        """
-        cache_key = self._make_cache_key(dependency_func, request_data)
-        request_cache = self._get_request_cache(request_data)
 
+        Security dependencies get their scopes injected as SecurityScopes.
+        """
+        dependency_func = node.func
         # First check (without lock)
-        hit, value = self._try_get_cached(cache_key, request_cache)
-        if hit:
+        value = self._try_get_cached(dependency_func, state)
+        if value is not _MISSING:
             return value
 
         # Get or create lock for this function
-        func_id = id(dependency_func)
         with self._execution_locks_lock:
-            if func_id not in self._execution_locks:
-                self._execution_locks[func_id] = threading.Lock()
-            func_lock = self._execution_locks[func_id]
+            func_lock = self._execution_locks.get(dependency_func)
+            if func_lock is None:
+                func_lock = self._execution_locks[dependency_func] = threading.Lock()
 
         # Synchronize execution per function
         with func_lock:
             # Second check (double-checked locking pattern)
-            hit, value = self._try_get_cached(cache_key, request_cache)
-            if hit:
+            value = self._try_get_cached(dependency_func, state)
+            if value is not _MISSING:
                 return value
 
-            # Guard against circular dependencies
-            with self._resolving_guard(request_cache, dependency_func, param_name):
-                sub_dependencies = self._resolve_sub_dependencies(
-                    dependency_func, request_data, security_scopes
-                )
-                result = self._call_dependency(
-                    dependency_func, sub_dependencies or {}, request_data
-                )
-                self._cache_result(cache_key, result, request_cache)
-                return result
+            if node.is_leaf:
+                result = self._call_dependency(dependency_func, {}, state, node.kind)
+                return self._cache_result(dependency_func, result, state)
+
+            # Cycles are rejected when the plan is compiled
+            sub_dependencies = self._resolve_sub_dependencies(node, request_data, state)
+            result = self._call_dependency(
+                dependency_func, sub_dependencies, state, node.kind
+            )
+            return self._cache_result(dependency_func, result, state)
 
     def _call_sync_generator(
         self,
         dependency_func: Callable,
         kwargs: dict,
-        request_data: RequestData,
+        state: _RequestState,
     ) -> Any:
         """Execute a sync generator dependency: yield value and save for cleanup."""
         gen = dependency_func(**kwargs)
@@ -223,14 +245,14 @@ class DependencyResolver:
             raise DependencyError(
                 f"Generator dependency " f"'{dependency_func.__name__}' did not yield"
             )
-        self._get_request_cache(request_data)["generators"].append(gen)
+        state.generators.append(gen)
         return value
 
     async def _call_async_generator(
         self,
         dependency_func: Callable,
         kwargs: dict,
-        request_data: RequestData,
+        state: _RequestState,
     ) -> Any:
         """Execute an async generator dependency: yield value and save for cleanup."""
         gen = dependency_func(**kwargs)
@@ -240,19 +262,22 @@ class DependencyResolver:
             raise DependencyError(
                 f"Generator dependency " f"'{dependency_func.__name__}' did not yield"
             )
-        self._get_request_cache(request_data)["generators"].append(gen)
+        state.generators.append(gen)
         return value
 
     def _call_dependency(
         self,
         dependency_func: Callable,
         kwargs: dict,
-        request_data: RequestData,
+        state: _RequestState,
+        kind: int | None = None,
     ) -> Any:
         """Execute the dependency function"""
+        if kind is None:
+            kind = _get_dependency_kind(dependency_func)
         try:
-            if inspect.isgeneratorfunction(dependency_func):
-                return self._call_sync_generator(dependency_func, kwargs, request_data)
+            if kind == CO_GENERATOR:
+                return self._call_sync_generator(dependency_func, kwargs, state)
             return dependency_func(**kwargs)
         except (DependencyError, APIError):
             raise
@@ -261,59 +286,63 @@ class DependencyResolver:
                 f"Dependency function '{dependency_func.__name__}' failed"
             ) from e
 
-    def _classify_params(self, dependency_func, security_scopes):
-        """Split function params into injected, dependency, and regular."""
-        sig = self._get_signature(dependency_func)
-        injected = {}
-        dependency_params = {}
-        regular_params = {}
-        for param_name, param in sig.items():
-            if param.annotation is SecurityScopes:
-                injected[param_name] = security_scopes or SecurityScopes()
-            elif isinstance(param.default, (Depends, Security)):
-                dependency_params[param_name] = param
-            else:
-                regular_params[param_name] = param
-        return injected, dependency_params, regular_params
+    def _classify_params(self, node: DependencyNode):
+        """Split non-dependency function params into injected and regular."""
+        split = self._params_cache.get(node.func)
+        if split is None:
+            try:
+                sig = self._get_signature(node.func)
+            except (TypeError, ValueError) as e:
+                raise DependencyError(
+                    f"Failed to resolve dependency '{node.name}'"
+                ) from e
+            scope_params = tuple(
+                name
+                for name, param in sig.items()
+                if param.annotation is SecurityScopes
+            )
+            regular_params = {
+                name: param
+                for name, param in sig.items()
+                if param.annotation is not SecurityScopes
+                and not isinstance(param.default, (Depends, Security))
+            }
+            split = self._params_cache[node.func] = (scope_params, regular_params)
+
+        scope_params, regular_params = split
+        if not scope_params:
+            return {}, regular_params
+        security_scopes = node.security_scopes or SecurityScopes()
+        return dict.fromkeys(scope_params, security_scopes), regular_params
 
     def _resolve_sub_dependencies(
         self,
-        dependency_func: Callable,
+        node: DependencyNode,
         request_data: RequestData,
-        security_scopes: SecurityScopes | None = None,
+        state: _RequestState,
     ) -> dict[str, Any]:
         """
         Resolve sub-dependencies for a dependency function
         This enables recursive dependency injection
         """
-        injected, dependency_params, regular_params = self._classify_params(
-            dependency_func, security_scopes
-        )
-        sub_dependencies = dict(injected)
+        dependency_func = node.func
+        injected, regular_params = self._classify_params(node)
+        # _classify_params builds a fresh dict per call, so extend it in place
+        sub_dependencies = injected
 
         # Resolve dependency parameters recursively
-        for param_name, param in dependency_params.items():
-            value = self._resolve_single_dependency(
-                param.default, request_data, param_name, param.annotation
+        for sub_node in self.compile_plan(dependency_func):
+            sub_dependencies[sub_node.name] = self._execute_dependency_function(
+                sub_node, request_data, state
             )
-            sub_dependencies[param_name] = value
 
         # Resolve regular parameters using ParameterResolver
         if regular_params:
             try:
-                from fastopenapi.resolution.resolver import ParameterResolver
-
-                # Create temporary function with only regular parameters
-                def _temp():  # pragma: no cover
-                    return None
-
-                temp_sig = inspect.Signature(regular_params.values())
-                temp_func = _temp
-                temp_func.__signature__ = temp_sig
-                temp_func.__name__ = f"temp_deps_for_{dependency_func.__name__}"
-
-                # Resolve all regular parameters using full ParameterResolver
-                resolved_regular = ParameterResolver.resolve(temp_func, request_data)
+                parameter_resolver = self._get_parameter_resolver()
+                resolved_regular = parameter_resolver.resolve_parameters(
+                    dependency_func, regular_params, request_data
+                )
                 sub_dependencies.update(resolved_regular)
 
             except (DependencyError, APIError):
@@ -353,26 +382,26 @@ class DependencyResolver:
         Returns:
             Dict mapping parameter names to resolved dependency values
         """
+        # Endpoints without dependencies need no request-scoped tracking
+        if not self.compile_plan(endpoint):
+            return {}
+
         # Initialize request-scoped tracking
+        request_id = id(request_data)
         with self._request_cache_lock:
-            if request_data not in self._request_cache:
-                self._request_cache[request_data] = {
-                    "resolved": {},
-                    "resolving": set(),
-                    "generators": [],
-                }
+            state = self._request_cache.get(request_id)
+            if state is None:
+                state = self._request_cache[request_id] = _RequestState()
 
         try:
             return await self._resolve_endpoint_dependencies_async(
-                endpoint, request_data
+                endpoint, request_data, state
             )
         finally:
-            # Get generators before deleting cache
             with self._request_cache_lock:
-                cache = self._request_cache.get(request_data, {})
-                generators = list(cache.get("generators", []))
+                self._request_cache.pop(request_id, None)
             # Close generators (triggers finally blocks)
-            for gen in generators:
+            for gen in state.generators:
                 try:
                     if inspect.isasyncgen(gen):
                         await gen.aclose()
@@ -380,130 +409,71 @@ class DependencyResolver:
                         gen.close()
                 except Exception:
                     pass
-            # Clean up request cache
-            with self._request_cache_lock:
-                if request_data in self._request_cache:
-                    del self._request_cache[request_data]
 
     async def _resolve_endpoint_dependencies_async(
-        self, endpoint: Callable, request_data: RequestData
+        self, endpoint: Callable, request_data: RequestData, state: _RequestState
     ) -> dict[str, Any]:
         """Resolve dependencies for a specific endpoint (async)"""
         dependencies = {}
-        sig = self._get_signature(endpoint)
-
-        for param_name, param in sig.items():
-            if isinstance(param.default, (Depends, Security)):
-                try:
-                    value = await self._resolve_single_dependency_async(
-                        param.default, request_data, param_name, param.annotation
-                    )
-                    dependencies[param_name] = value
-                except (DependencyError, APIError) as e:
-                    raise e
-                except Exception as e:
-                    raise DependencyError(
-                        f"Failed to resolve dependency '{param_name}'"
-                    ) from e
+        plan = self.compile_plan(endpoint)
 
-        return dependencies
-
-    async def _resolve_single_dependency_async(
-        self,
-        dependency: Depends | Security,
-        request_data: RequestData,
-        param_name: str = None,
-        param_annotation: type = None,
-    ) -> Any:
-        """Resolve a single dependency with caching and recursion (async)"""
-        # Get the dependency function
-        dependency_func = self._get_dependency_func(
-            dependency, param_name, param_annotation
-        )
-
-        # Handle Security-specific logic
-        if isinstance(dependency, Security):
-            return await self._resolve_security_dependency_async(
-                dependency, dependency_func, request_data, param_name
+        # Failures are raised as DependencyError/APIError where they occur
+        for node in plan:
+            dependencies[node.name] = await self._execute_dependency_function_async(
+                node, request_data, state
             )
 
-        # Handle regular Depends
-        return await self._resolve_regular_dependency_async(
-            dependency, dependency_func, request_data, param_name
-        )
-
-    async def _resolve_security_dependency_async(
-        self,
-        security: Security,
-        dependency_func: Callable,
-        request_data: RequestData,
-        param_name: str,
-    ) -> Any:
-        """Resolve Security dependency, injecting SecurityScopes if requested"""
-        return await self._execute_dependency_function_async(
-            dependency_func,
-            request_data,
-            param_name,
-            security_scopes=SecurityScopes(security.scopes),
-        )
-
-    async def _resolve_regular_dependency_async(
-        self,
-        depends: Depends,
-        dependency_func: Callable,
-        request_data: RequestData,
-        param_name: str,
-    ) -> Any:
-        """Resolve regular Depends dependency (async)"""
-        return await self._execute_dependency_function_async(
-            dependency_func, request_data, param_name
-        )
+        return dependencies
 
     async def _execute_dependency_function_async(
         self,
-        dependency_func: Callable,
+        node: DependencyNode,
         request_data: RequestData,
-        param_name: str,
-        security_scopes: SecurityScopes | None = None,
+        state: _RequestState,
     ) -> Any:
         """
         Execute dependency function with caching and circular dependency detection
-        """
-        cache_key = self._make_cache_key(dependency_func, request_data)
-        request_cache = self._get_request_cache(request_data)
 
-        hit, value = self._try_get_cached(cache_key, request_cache)
-        if hit:
+        Security dependencies get their scopes injected as SecurityScopes.
+        """
+        dependency_func = node.func
+        value = self._try_get_cached(dependency_func, state)
+        if value is not _MISSING:
             return value
 
-        # Guard against circular dependencies
-        with self._resolving_guard(request_cache, dependency_func, param_name):
-            sub_dependencies = await self._resolve_sub_dependencies_async(
-                dependency_func, request_data, security_scopes
-            )
+        if node.is_leaf:
             result = await self._call_dependency_async(
-                dependency_func, sub_dependencies or {}, request_data
+                dependency_func, {}, state, node.kind
             )
-            self._cache_result(cache_key, result, request_cache)
-            return result
+            return self._cache_result(dependency_func, result, state)
+
+        # Cycles are rejected when the plan is compiled
+        sub_dependencies = await self._resolve_sub_dependencies_async(
+            node, request_data, state
+        )
+        result = await self._call_dependency_async(
+            dependency_func, sub_dependencies, state, node.kind
+        )
+        return self._cache_result(dependency_func, result, state)
 
     async def _call_dependency_async(
         self,
         dependency_func: Callable,
         kwargs: dict,
-        request_data: RequestData,
+        state: _RequestState,
+        kind: int | None = None,
     ) -> Any:
         """
         Execute the dependency function (async - handles both sync and async funcs)
         """
+        if kind is None:
+            kind = _get_dependency_kind(dependency_func)
         try:
-            if inspect.isasyncgenfunction(dependency_func):
-                return await self._call_async_generator(
-                    dependency_func, kwargs, request_data
-                )
-            if inspect.isgeneratorfunction(dependency_func):
-                return self._call_sync_generator(dependency_func, kwargs, request_data)
-            if inspect.iscoroutinefunction(dependency_func):
+            if kind == CO_ASYNC_GENERATOR:
+                return await self._call_async_generator(dependency_func, kwargs, state)
+            if kind == CO_GENERATOR:
+                return self._call_sync_generator(dependency_func, kwargs, state)
+            if kind == CO_COROUTINE:
                 return await dependency_func(**kwargs)
             return dependency_func(**kwargs)
         except (DependencyError, APIError):
@@ -515,42 +485,34 @@ class DependencyResolver:
 
     async def _resolve_sub_dependencies_async(
         self,
-        dependency_func: Callable,
+        node: DependencyNode,
         request_data: RequestData,
-        security_scopes: SecurityScopes | None = None,
+        state: _RequestState,
     ) -> dict[str, Any]:
         """
         Resolve sub-dependencies for a dependency function (async)
         This enables recursive dependency injection
         """
-        injected, dependency_params, regular_params = self._classify_params(
-            dependency_func, security_scopes
-        )
-        sub_dependencies = dict(injected)
+        dependency_func = node.func
+        injected, regular_params = self._classify_params(node)
+        # _classify_params builds a fresh dict per call, so extend it in place
+        sub_dependencies = injected
 
         # Resolve dependency parameters recursively (async)
-        for param_name, param in dependency_params.items():
-            value = await self._resolve_single_dependency_async(
-                param.default, request_data, param_name, param.annotation
+        for sub_node in self.compile_plan(dependency_func):
+            sub_dependencies[sub_node.name] = (
+                await self._execute_dependency_function_async(
+                    sub_node, request_data, state
+                )
             )
-            sub_dependencies[param_name] = value
 
         # Resolve regular parameters using ParameterResolver
         if regular_params:
             try:
-                from fastopenapi.resolution.resolver import ParameterResolver
-
-                # Create temporary function with only regular parameters
-                def _temp():  # pragma: no cover
-                    return None
-
-                temp_sig = inspect.Signature(regular_params.values())
-                temp_func = _temp
-                temp_func.__signature__ = temp_sig
-                temp_func.__name__ = f"temp_deps_for_{dependency_func.__name__}"
-
-                # Resolve all regular parameters using full ParameterResolver
-                resolved_regular = ParameterResolver.resolve(temp_func, request_data)
+                parameter_resolver = self._get_parameter_resolver()
+                resolved_regular = parameter_resolver.resolve_parameters(
+                    dependency_func, regular_params, request_data
+                )
                 sub_dependencies.update(resolved_regular)
 
             except (DependencyError, APIError):
@@ -575,6 +537,15 @@ class DependencyResolver:
 
         return sub_dependencies
 
+    @classmethod
+    def _get_parameter_resolver(cls) -> type:
+        """Get ParameterResolver, importing it once on first use"""
+        if cls._parameter_resolver is None:
+            from fastopenapi.resolution.resolver import ParameterResolver
+
+            cls._parameter_resolver = ParameterResolver
+        return cls._parameter_resolver
+
     def _get_dependency_func(
         self,
         dependency: Depends | Security,
@@ -593,54 +564,116 @@ class DependencyResolver:
                 )
         return dependency_func
 
-    def _make_cache_key(
-        self, dependency_func: Callable, request_data: RequestData
-    ) -> tuple:
-        """Create cache key for request-scoped cache"""
-        return (id(dependency_func), id(request_data))
-
-    def _get_request_cache(self, request_data: RequestData) -> dict:
-        """Get cache dictionary for current request"""
-        return self._request_cache[request_data]
+    def _try_get_cached(self, dependency_func: Callable, state: _RequestState) -> Any:
+        """Get cached value from request-scoped cache, or ``_MISSING`` on a miss"""
+        # A single dict read is atomic, so cache hits don't take the lock
+        return state.resolved.get(dependency_func, _MISSING)
 
-    def _try_get_cached(
-        self, cache_key: tuple, request_cache: dict
-    ) -> tuple[bool, Any]:
-        """Try to get cached value from request-scoped cache"""
+    def _cache_result(
+        self, dependency_func: Callable, result: Any, state: _RequestState
+    ) -> Any:
+        """Store result in request-scoped cache and return the cached value"""
         with self._request_cache_lock:
-            resolved = request_cache["resolved"]
-            if cache_key in resolved:
-                return True, resolved[cache_key]
-        return False, None
+            # Re-check under the lock: the first stored result wins
+            return state.resolved.setdefault(dependency_func, result)
+
+    @staticmethod
+    def _circular_dependency_error(
+        chain: list[Callable], param_name: str
+    ) -> CircularDependencyError:
+        """Build the error raised when a dependency chain leads back to itself"""
+        path = " -> ".join(getattr(func, "__name__", repr(func)) for func in chain)
+        return CircularDependencyError(
+            f"Circular dependency detected for '{param_name}': {path}"
+        )
 
-    def _cache_result(self, cache_key: tuple, result: Any, request_cache: dict) -> None:
-        """Store result in request-scoped cache"""
-        with self._request_cache_lock:
-            request_cache["resolved"][cache_key] = result
-
-    @contextmanager
-    def _resolving_guard(
-        self, request_cache: dict, dependency_func: Callable, param_name: str
-    ):
-        """Guard against circular dependencies"""
-        resolving = request_cache["resolving"]
-        if dependency_func in resolving:
-            raise CircularDependencyError(
-                f"Circular dependency detected for '{param_name}': "
-                f"{dependency_func.__name__} -> ... -> {dependency_func.__name__}"
-            )
-        resolving.add(dependency_func)
+    def compile_plan(self, endpoint: Callable) -> tuple[DependencyNode, ...]:
+        """
+        Compile the dependency plan for an endpoint or dependency function
+
+        The plan holds a DependencyNode for every Depends/Security parameter
+        (SecurityScopes parameters are injected, not resolved) and is cached,
+        so requests iterate it without inspecting signatures. Sub-dependency
+        plans are compiled along with it, and circular dependencies raise
+        CircularDependencyError here rather than at request time. Routers
+        call this when a route is registered.
+        """
+        plan = self._plan_cache.get(endpoint)
+        if plan is None:
+            plan = self._compile_plan(endpoint, [])
+        return plan
+
+    def _compile_plan(
+        self, func: Callable, chain: list[Callable]
+    ) -> tuple[DependencyNode, ...]:
+        """Compile and cache plans depth-first, tracking the chain for cycles"""
+        plan = self._plan_cache.get(func)
+        if plan is not None:
+            return plan
+
+        plan = tuple(
+            self._compile_node(param_name, param)
+            for param_name, param in self._get_signature(func).items()
+            if isinstance(param.default, (Depends, Security))
+            and param.annotation is not SecurityScopes
+        )
+        chain.append(func)
         try:
-            yield
+            for node in plan:
+                if node.func in chain:
+                    start = chain.index(node.func)
+                    raise self._circular_dependency_error(
+                        chain[start:] + [node.func], node.name
+                    )
+                if node.is_leaf:
+                    continue
+                try:
+                    self._compile_plan(node.func, chain)
+                except (TypeError, ValueError):
+                    # Not introspectable; fails with context when executed
+                    continue
         finally:
-            resolving.discard(dependency_func)
+            chain.pop()
+
+        self._plan_cache[func] = plan
+        return plan
+
+    def _compile_node(
+        self, param_name: str, param: inspect.Parameter
+    ) -> DependencyNode:
+        """Build the plan node for a Depends/Security parameter"""
+        dependency = param.default
+        func = self._get_dependency_func(dependency, param_name, param.annotation)
+        try:
+            hash(func)
+        except TypeError:
+            # Every resolver cache, including the request cache, is keyed by it
+            raise DependencyError(
+                f"Dependency function for parameter '{param_name}' must be "
+                f"hashable, got an unhashable {type(func).__name__}"
+            ) from None
+        try:
+            is_leaf = not self._get_signature(func)
+        except (TypeError, ValueError):
+            # No introspectable signature; take the general path at request time
+            is_leaf = False
+        return DependencyNode(
+            name=param_name,
+            dependency=dependency,
+            func=func,
+            security_scopes=(
+                dependency.security_scopes if isinstance(dependency, Security) else None
+            ),
+            is_leaf=is_leaf,
+            kind=_get_dependency_kind(func),
+        )
 
     def _get_signature(self, func: Callable) -> dict[str, inspect.Parameter]:
         """Get function signature with caching"""
-        if func not in self._signature_cache:
-            sig = inspect.signature(func)
-            self._signature_cache[func] = sig.parameters
-        return self._signature_cache[func]
+        params = self._signature_cache.get(func)
+        if params is None:
+            params = self._signature_cache[func] = inspect.signature(func).parameters
+        return params
 
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics for monitoring"""
@@ -10,6 +10,28 @@ from pydantic.fields import FieldInfo
 
 from fastopenapi.core.constants import ParameterSource
 
+# FieldInfo options forwarded by BaseParam, in signature order
+_FIELD_INFO_KEYS = (
+    "alias",
+    "title",
+    "description",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "min_length",
+    "max_length",
+    "pattern",
+    "strict",
+    "multiple_of",
+    "allow_inf_nan",
+    "max_digits",
+    "decimal_places",
+    "examples",
+    "deprecated",
+    "json_schema_extra",
+)
+
 
 class BaseParam(FieldInfo):
     """Base parameter class extending Pydantic FieldInfo"""
@@ -40,38 +62,40 @@ class BaseParam(FieldInfo):
         json_schema_extra: dict[str, Any] | None = None,
         **extra: Any,
     ):
-        # Build kwargs for FieldInfo
-        kwargs = {
-            "default": default,
-            "alias": alias,
-            "title": title,
-            "description": description,
-            "gt": gt,
-            "ge": ge,
-            "lt": lt,
-            "le": le,
-            "min_length": min_length,
-            "max_length": max_length,
-            "pattern": pattern,
-            "strict": strict,
-            "multiple_of": multiple_of,
-            "allow_inf_nan": allow_inf_nan,
-            "max_digits": max_digits,
-            "decimal_places": decimal_places,
-            "deprecated": deprecated,
-            "json_schema_extra": json_schema_extra,
-            **extra,
-        }
-
-        # Filter out None values
-        filtered_kwargs = {
-            k: v for k, v in kwargs.items() if v is not None or k == "default"
-        }
-
-        super().__init__(**filtered_kwargs)
+        # Only forward the options that were actually set
+        kwargs = {"default": default}
+        for key, value in zip(
+            _FIELD_INFO_KEYS,
+            (
+                alias,
+                title,
+                description,
+                gt,
+                ge,
+                lt,
+                le,
+                min_length,
+                max_length,
+                pattern,
+                strict,
+                multiple_of,
+                allow_inf_nan,
+                max_digits,
+                decimal_places,
+                examples,
+                deprecated,
+                json_schema_extra,
+            ),
+        ):
+            if value is not None:
+                kwargs[key] = value
+        for key, value in extra.items():
+            if value is not None:
+                kwargs[key] = value
+
+        super().__init__(**kwargs)
 
         self.example = example
-        self.examples = examples
         self.include_in_schema = include_in_schema
 
     def __repr__(self) -> str:
@@ -81,56 +105,7 @@ class BaseParam(FieldInfo):
 class Param(BaseParam):
     """Base parameter class for URL/header/cookie parameters"""
 
-    in_: ParameterSource
-
-    def __init__(
-        self,
-        default: Any = ...,
-        *,
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+    in_ = ParameterSource.QUERY
 
 
 class Query(Param):
@@ -138,54 +113,8 @@ class Query(Param):
 
     in_ = ParameterSource.QUERY
 
-    def __init__(
-        self,
-        default: Any = None,
-        *,
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+    def __init__(self, default: Any = None, **kwargs: Any):
+        BaseParam.__init__(self, default, **kwargs)
 
 
 class Path(Param):
@@ -193,58 +122,12 @@ class Path(Param):
 
     in_ = ParameterSource.PATH
 
-    def __init__(
-        self,
-        default: Any = ...,  # Path params must be required
-        *,
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
+    def __init__(self, default: Any = ..., **kwargs: Any):
         # Path parameters cannot have defaults
         if default is not ...:
             raise ValueError("Path parameters cannot have a default value")
 
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+        BaseParam.__init__(self, default, **kwargs)
 
 
 class Header(Param):
@@ -253,56 +136,10 @@ class Header(Param):
     in_ = ParameterSource.HEADER
 
     def __init__(
-        self,
-        default: Any = None,
-        *,
-        alias: str | None = None,
-        convert_underscores: bool = True,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
+        self, default: Any = None, *, convert_underscores: bool = True, **kwargs: Any
     ):
         self.convert_underscores = convert_underscores
-
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+        BaseParam.__init__(self, default, **kwargs)
 
 
 class Cookie(Param):
@@ -310,227 +147,48 @@ class Cookie(Param):
 
     in_ = ParameterSource.COOKIE
 
-    def __init__(
-        self,
-        default: Any = None,
-        *,
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+    def __init__(self, default: Any = None, **kwargs: Any):
+        BaseParam.__init__(self, default, **kwargs)
 
 
 class Body(BaseParam):
     """Body parameter for JSON request bodies"""
 
+    media_type = "application/json"
+
     def __init__(
         self,
         default: Any = None,
         *,
         embed: bool | None = None,
-        media_type: str = "application/json",
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
+        media_type: str | None = None,
+        **kwargs: Any,
     ):
-        super().__init__(
-            default=default,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+        BaseParam.__init__(self, default, **kwargs)
 
         self.embed = embed
-        self.media_type = media_type
+        # Subclasses provide their default media type at class level
+        if media_type is not None:
+            self.media_type = media_type
 
 
 class Form(Body):
     """Form data parameter"""
 
-    def __init__(
-        self,
-        default: Any = None,
-        *,
-        media_type: str = "application/x-www-form-urlencoded",
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
-        super().__init__(
-            default=default,
-            media_type=media_type,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+    media_type = "application/x-www-form-urlencoded"
 
 
 class File(Form):
     """File upload parameter"""
 
-    def __init__(
-        self,
-        default: Any = None,
-        *,
-        media_type: str = "multipart/form-data",
-        alias: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        gt: float | None = None,
-        ge: float | None = None,
-        lt: float | None = None,
-        le: float | None = None,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        pattern: str | None = None,
-        strict: bool | None = None,
-        multiple_of: float | None = None,
-        allow_inf_nan: bool | None = None,
-        max_digits: int | None = None,
-        decimal_places: int | None = None,
-        examples: list[Any] | None = None,
-        deprecated: bool | None = None,
-        include_in_schema: bool = True,
-        json_schema_extra: dict[str, Any] | None = None,
-        **extra: Any,
-    ):
-        super().__init__(
-            default=default,
-            media_type=media_type,
-            alias=alias,
-            title=title,
-            description=description,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            pattern=pattern,
-            strict=strict,
-            multiple_of=multiple_of,
-            allow_inf_nan=allow_inf_nan,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            examples=examples,
-            deprecated=deprecated,
-            include_in_schema=include_in_schema,
-            json_schema_extra=json_schema_extra,
-            **extra,
-        )
+    media_type = "multipart/form-data"
 
 
 class Depends:
     """Dependency injection marker"""
 
+    __slots__ = ("dependency",)
+
     def __init__(self, dependency: Callable[..., Any] | None = None):
         self.dependency = dependency
 
@@ -542,6 +200,8 @@ class Depends:
 class Security(Depends):
     """Security dependency with scopes"""
 
+    __slots__ = ("scopes", "security_scopes")
+
     def __init__(
         self,
         dependency: Callable[..., Any] | None = None,
@@ -549,11 +209,15 @@ class Security(Depends):
         scopes: Sequence[str] | None = None,
     ):
         super().__init__(dependency=dependency)
-        self.scopes = list(scopes) if scopes else []
+        self.scopes = tuple(scopes) if scopes else ()
+        # Scopes are fixed per marker, so the injected object is built once
+        self.security_scopes = SecurityScopes(list(self.scopes))
 
 
 class SecurityScopes:
     """Required scopes injected into security dependency functions"""
 
+    __slots__ = ("scopes",)
+
     def __init__(self, scopes: list[str] | None = None):
         self.scopes = scopes or []
@@ -7,16 +7,25 @@ from fastopenapi.core.constants import (
     SUPPORTED_METHODS,
     SecuritySchemeType,
 )
+from fastopenapi.core.dependency_resolver import dependency_resolver
+from fastopenapi.errors.exceptions import CircularDependencyError, DependencyError
+
+# Maps each supported method to its canonical string, so every route shares
+# the same method objects and validation is a single dict lookup
+_CANONICAL_METHODS = {method: method for method in SUPPORTED_METHODS}
 
 
 class RouteInfo:
     """Container for route information"""
 
+    __slots__ = ("path", "method", "endpoint", "meta")
+
     def __init__(self, path: str, method: str, endpoint: Callable, meta: dict):
-        if method.upper() not in SUPPORTED_METHODS:
+        canonical = _CANONICAL_METHODS.get(method.upper())
+        if canonical is None:
             raise ValueError(f"Unsupported method: {method}")
         self.path = path
-        self.method = method.upper()
+        self.method = canonical
         self.endpoint = endpoint
         self.meta = meta
 
@@ -89,17 +98,23 @@ class BaseRouter:
             pass
         meta = getattr(endpoint, "__route_meta__", {"method": method})
         route = RouteInfo(path, method, endpoint, meta)
+        # Compile the dependency plan up front instead of on the first request.
+        # Cycles fail registration; other compile errors are reported when the
+        # endpoint's dependencies are resolved
+        try:
+            dependency_resolver.compile_plan(endpoint)
+        except CircularDependencyError:
+            raise
+        except (TypeError, ValueError, DependencyError):
+            pass
         self._routes.append(route)
         self._openapi_schema = None
 
     def include_router(self, other: "BaseRouter", prefix: str = ""):
         """Include routes from another router"""
+        base = f"{prefix.rstrip('/')}/" if prefix else ""
         for route in other._routes:
-            path = (
-                f"{prefix.rstrip('/')}/{route.path.lstrip('/')}"
-                if prefix
-                else route.path
-            )
+            path = base + route.path.lstrip("/") if base else route.path
             self.add_route(path, route.method, route.endpoint)
 
         # Merge security schemes
@@ -1,6 +1,11 @@
 import inspect
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only stand-in for request data sections that are absent
+_EMPTY = MappingProxyType({})
+
 
 class FileUpload:
     """Unified file upload container with framework-agnostic API"""
@@ -61,6 +66,8 @@ class FileUpload:
 class Response:
     """Custom response with headers"""
 
+    __slots__ = ("content", "status_code", "headers")
+
     def __init__(
         self,
         content: Any,
@@ -73,22 +80,36 @@ class Response:
 
 
 class RequestData:
-    """Unified request data container"""
+    """Unified request data container
+
+    Sections passed as None share one read-only empty mapping; mappings passed
+    in are kept as given.
+    """
+
+    __slots__ = (
+        "path_params",
+        "query_params",
+        "headers",
+        "cookies",
+        "body",
+        "form_data",
+        "files",
+    )
 
     def __init__(
         self,
-        path_params: dict[str, Any] = None,
-        query_params: dict[str, Any] = None,
-        headers: dict[str, str] = None,
-        cookies: dict[str, str] = None,
+        path_params: Mapping[str, Any] | None = None,
+        query_params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        cookies: Mapping[str, str] | None = None,
         body: Any = None,
-        form_data: dict[str, Any] = None,
-        files: dict[str, FileUpload | list[FileUpload]] = None,
+        form_data: Mapping[str, Any] | None = None,
+        files: Mapping[str, FileUpload | list[FileUpload]] | None = None,
     ):
-        self.path_params = path_params or {}
-        self.query_params = query_params or {}
-        self.headers = headers or {}
-        self.cookies = cookies or {}
+        self.path_params = path_params if path_params is not None else _EMPTY
+        self.query_params = query_params if query_params is not None else _EMPTY
+        self.headers = headers if headers is not None else _EMPTY
+        self.cookies = cookies if cookies is not None else _EMPTY
         self.body = body
-        self.form_data = form_data or {}
-        self.files = files or {}
+        self.form_data = form_data if form_data is not None else _EMPTY
+        self.files = files if files is not None else _EMPTY
@@ -15,6 +15,24 @@ STATUS_TO_ERROR_TYPE = {
     HTTPStatus.SERVICE_UNAVAILABLE: ErrorType.SERVICE_UNAVAILABLE,
 }
 
+# Attributes probed on foreign exceptions, in priority order
+_STATUS_ATTRS = ("status_code", "code")
+_MESSAGE_ATTRS = ("message", "title", "name", "reason", "detail")
+_MISSING = object()
+# Direct code lookup, avoiding the Python-level HTTPStatus(...) enum call
+_HTTP_STATUSES = {status.value: status for status in HTTPStatus}
+
+
+def _lookup_mapped_error(
+    exc_type: type[Exception], mapper: dict[type[Exception], type["APIError"]]
+) -> type["APIError"] | None:
+    """Find the mapper entry of the nearest mapped base class of exc_type"""
+    for base in exc_type.__mro__:
+        entry = mapper.get(base)
+        if entry:
+            return entry
+    return None
+
 
 class APIError(Exception):
     """Base exception class for all API errors"""
@@ -55,24 +73,27 @@ class APIError(Exception):
         if isinstance(exc, APIError):
             return exc
 
-        mapper = mapper or {}
-        entry = mapper.get(type(exc))
+        entry = _lookup_mapped_error(type(exc), mapper) if mapper else None
         if entry:
             return entry(str(exc))
 
         status = HTTPStatus.INTERNAL_SERVER_ERROR
-        for attr in ("status_code", "code"):
-            if hasattr(exc, attr):
+        for attr in _STATUS_ATTRS:
+            value = getattr(exc, attr, _MISSING)
+            if value is not _MISSING:
                 try:
-                    status = HTTPStatus(int(getattr(exc, attr)))
-                    break
+                    candidate = _HTTP_STATUSES.get(int(value))
                 except Exception:  # pragma: no cover
-                    pass
+                    continue
+                if candidate is not None:
+                    status = candidate
+                    break
 
         message = str(exc)
-        for attr in ("message", "title", "name", "reason", "detail"):
-            if hasattr(exc, attr):
-                message = str(getattr(exc, attr))
+        for attr in _MESSAGE_ATTRS:
+            value = getattr(exc, attr, _MISSING)
+            if value is not _MISSING:
+                message = str(value)
                 break
 
         err_type = STATUS_TO_ERROR_TYPE.get(status, ErrorType.INTERNAL_SERVER_ERROR)
@@ -1,14 +1,17 @@
+import copy
 import inspect
 import re
 import threading
 import types
 import typing
+from collections.abc import Callable
 from dataclasses import dataclass
 from functools import lru_cache
+from http import HTTPStatus
 from typing import Any
 
 from pydantic import BaseModel
-from pydantic_core import PydanticUndefined
+from pydantic_core import PydanticUndefined, to_json
 
 from fastopenapi.core.constants import PYTHON_TYPE_MAPPING, ParameterSource
 from fastopenapi.core.params import (
@@ -26,6 +29,50 @@ from fastopenapi.core.params import (
 PATH_PARAM_PATTERN = re.compile(r"<(?:[^:>]+:)?([^>]+)>")
 OPENAPI_PATH_PATTERN = re.compile(r"{(\w+)}")
 
+_UNION_ORIGINS = (typing.Union, types.UnionType)
+_OBJECT_METADATA_ATTRS = ("title", "description", "example", "examples")
+_CONSTRAINT_MAPPING = {
+    "MinLen": ("min_length", "minLength"),
+    "MaxLen": ("max_length", "maxLength"),
+    "Ge": ("ge", "minimum"),
+    "Le": ("le", "maximum"),
+    "Gt": ("gt", "exclusiveMinimum"),
+    "Lt": ("lt", "exclusiveMaximum"),
+    "MultipleOf": ("multiple_of", "multipleOf"),
+}
+_LOCATION_MAPPING = {
+    ParameterSource.QUERY: "query",
+    ParameterSource.HEADER: "header",
+    ParameterSource.COOKIE: "cookie",
+    ParameterSource.PATH: "path",
+}
+_COMMON_DESCRIPTIONS = {
+    "page": "Pagination page",
+    "limit": "Pagination limit",
+    "offset": "Pagination offset",
+    "sort": "Sorting sort",
+    "order": "Sorting order",
+    "sort_by": "Sorting sort_by",
+}
+_MISSING = object()
+
+
+def _is_model_class(annotation) -> bool:
+    """Check if annotation is a Pydantic model class"""
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@lru_cache(maxsize=1024)
+def _openapi_path(path: str) -> str:
+    """Convert a route path to OpenAPI format"""
+    return PATH_PARAM_PATTERN.sub(r"{\1}", path)
+
+
+@lru_cache(maxsize=1024)
+def _path_parameter_names(path: str) -> frozenset[str]:
+    """Extract the parameter names of a route path"""
+    return frozenset(OPENAPI_PATH_PATTERN.findall(_openapi_path(path)))
+
 
 @dataclass
 class ParameterInfo:
@@ -50,17 +97,19 @@ class SchemaBuilder:
 
     def build_parameter_schema(self, annotation) -> dict:
         """Build OpenAPI schema for a parameter annotation"""
+        schema_type = PYTHON_TYPE_MAPPING.get(annotation)
+        if schema_type is not None:
+            return {"type": schema_type}
+
         origin = typing.get_origin(annotation)
 
         if origin is list:
             return self._build_array_schema(annotation)
 
-        if origin is typing.Union or (
-            hasattr(types, "UnionType") and origin is types.UnionType
-        ):
+        if origin in _UNION_ORIGINS:
             return self._build_union_schema(annotation)
 
-        return {"type": PYTHON_TYPE_MAPPING.get(annotation, "string")}
+        return {"type": "string"}
 
     def _build_array_schema(self, annotation) -> dict:
         """Build schema for array types"""
@@ -104,40 +153,29 @@ class SchemaBuilder:
 
     def _apply_metadata_constraints(self, schema: dict, param_obj: BaseParam) -> None:
         """Apply constraints from param metadata"""
-        if not (hasattr(param_obj, "metadata") and param_obj.metadata):
+        metadata = getattr(param_obj, "metadata", None)
+        if not metadata:
             return
 
-        constraint_mapping = {
-            "MinLen": ("min_length", "minLength"),
-            "MaxLen": ("max_length", "maxLength"),
-            "Ge": ("ge", "minimum"),
-            "Le": ("le", "maximum"),
-            "Gt": ("gt", "exclusiveMinimum"),
-            "Lt": ("lt", "exclusiveMaximum"),
-            "MultipleOf": ("multiple_of", "multipleOf"),
-        }
-
-        for constraint in param_obj.metadata:
+        for constraint in metadata:
             constraint_type = type(constraint).__name__
 
-            if constraint_type in constraint_mapping:
-                attr_name, schema_key = constraint_mapping[constraint_type]
-                if hasattr(constraint, attr_name):  # pragma: no cover
-                    schema[schema_key] = getattr(constraint, attr_name)
-            elif (  # pragma: no cover
-                constraint_type == "_PydanticGeneralMetadata"
-                and hasattr(constraint, "pattern")
-            ):
-                schema["pattern"] = constraint.pattern
+            if constraint_type in _CONSTRAINT_MAPPING:
+                attr_name, schema_key = _CONSTRAINT_MAPPING[constraint_type]
+                value = getattr(constraint, attr_name, _MISSING)
+                if value is not _MISSING:  # pragma: no cover
+                    schema[schema_key] = value
+            elif constraint_type == "_PydanticGeneralMetadata":  # pragma: no cover
+                pattern = getattr(constraint, "pattern", _MISSING)
+                if pattern is not _MISSING:
+                    schema["pattern"] = pattern
 
     def _apply_object_metadata(self, schema: dict, param_obj: BaseParam) -> None:
         """Apply object-level metadata"""
-        attrs = ["title", "description", "example", "examples"]
-        for attr in attrs:
-            if hasattr(param_obj, attr):  # pragma: no cover
-                value = getattr(param_obj, attr)
-                if value:
-                    schema[attr] = value
+        for attr in _OBJECT_METADATA_ATTRS:
+            value = getattr(param_obj, attr, None)
+            if value:
+                schema[attr] = value
 
     def _apply_default_value(self, schema: dict, param_obj: BaseParam) -> None:
         """Apply default value if serializable"""
@@ -150,8 +188,6 @@ class SchemaBuilder:
             return
 
         try:
-            from pydantic_core import to_json
-
             to_json(param_obj.default)
             schema["default"] = param_obj.default
         except (TypeError, ValueError):
@@ -162,6 +198,10 @@ class SchemaBuilder:
         model_name = model.__name__
         cache_key = f"{model.__module__}.{model_name}"
 
+        # Fast path: dict lookups are atomic, so hits need no lock
+        if cache_key in self._model_schema_cache and model_name in self.definitions:
+            return {"$ref": f"#/components/schemas/{model_name}"}
+
         with self._cache_lock:
             if cache_key not in self._model_schema_cache:
                 self._cache_model_schema(model, cache_key)
@@ -180,9 +220,9 @@ class SchemaBuilder:
 
         # Process nested definitions
         for key in ("definitions", "$defs"):
-            if key in model_schema:
-                self.definitions.update(model_schema[key])
-                del model_schema[key]
+            definitions = model_schema.pop(key, None)
+            if definitions is not None:
+                self.definitions.update(definitions)
 
         self._model_schema_cache[cache_key] = model_schema
 
@@ -192,10 +232,22 @@ class ParameterProcessor:
 
     def __init__(self, schema_builder: SchemaBuilder):
         self.schema_builder = schema_builder
+        self._signature_cache: dict[Callable, types.MappingProxyType] = {}
+        self._query_model_schema_cache: dict[type[BaseModel], dict] = {}
+
+    def get_signature_parameters(
+        self, endpoint: Callable
+    ) -> types.MappingProxyType[str, inspect.Parameter]:
+        """Get endpoint signature parameters, computed once per generator"""
+        params = self._signature_cache.get(endpoint)
+        if params is None:
+            params = inspect.signature(endpoint).parameters
+            self._signature_cache[endpoint] = params
+        return params
 
     def process_route_parameters(self, route) -> tuple[list[dict], dict | None]:
         """Process route parameters and return parameters list and request body"""
-        sig = inspect.signature(route.endpoint)
+        params = self.get_signature_parameters(route.endpoint)
         path_params = self._extract_path_parameters(route.path)
 
         parameters = []
@@ -205,7 +257,7 @@ class ParameterProcessor:
         form_required = []
         has_explicit_embed = False
 
-        for param_name, param in sig.parameters.items():
+        for param_name, param in params.items():
             if self._should_skip_parameter(param):
                 continue
 
@@ -286,10 +338,9 @@ class ParameterProcessor:
             return next(iter(body_fields.values()))
         return None
 
-    def _extract_path_parameters(self, path: str) -> set:
+    def _extract_path_parameters(self, path: str) -> frozenset[str]:
         """Extract path parameters from route path"""
-        openapi_path = PATH_PARAM_PATTERN.sub(r"{\1}", path)
-        return set(OPENAPI_PATH_PATTERN.findall(openapi_path))
+        return _path_parameter_names(path)
 
     def _should_skip_parameter(self, param: inspect.Parameter) -> bool:
         """Determine if parameter should be skipped"""
@@ -303,7 +354,11 @@ class ParameterProcessor:
         return False
 
     def _process_single_parameter(
-        self, param_name: str, param: inspect.Parameter, path_params: set, method: str
+        self,
+        param_name: str,
+        param: inspect.Parameter,
+        path_params: frozenset[str],
+        method: str,
     ) -> tuple[str, Any] | None:
         """Process a single parameter and return its type and data"""
 
@@ -351,7 +406,7 @@ class ParameterProcessor:
             return "request_body", request_body
 
     def _build_parameter_info(
-        self, param_name: str, param: inspect.Parameter, path_params: set
+        self, param_name: str, param: inspect.Parameter, path_params: frozenset[str]
     ) -> dict | None:
         """Build parameter info with full Param object integration"""
         param_obj = param.default
@@ -387,17 +442,11 @@ class ParameterProcessor:
         return param_info
 
     def _determine_parameter_location_and_name(
-        self, param_name: str, param_obj: Any, path_params: set
+        self, param_name: str, param_obj: Any, path_params: frozenset[str]
     ) -> tuple[str, str]:
         """Determine parameter location and actual name"""
         if isinstance(param_obj, Param):
-            location_mapping = {
-                ParameterSource.QUERY: "query",
-                ParameterSource.HEADER: "header",
-                ParameterSource.COOKIE: "cookie",
-                ParameterSource.PATH: "path",
-            }
-            location = location_mapping.get(param_obj.in_, "query")
+            location = _LOCATION_MAPPING.get(param_obj.in_, "query")
             actual_name = param_obj.alias if param_obj.alias else param_name
 
             # Handle header name conversion
@@ -454,16 +503,9 @@ class ParameterProcessor:
 
         # Add default descriptions for common parameters
         if "description" not in param_info:
-            common_descriptions = {
-                "page": "Pagination page",
-                "limit": "Pagination limit",
-                "offset": "Pagination offset",
-                "sort": "Sorting sort",
-                "order": "Sorting order",
-                "sort_by": "Sorting sort_by",
-            }
-            if actual_name.lower() in common_descriptions:
-                param_info["description"] = common_descriptions[actual_name.lower()]
+            description = _COMMON_DESCRIPTIONS.get(actual_name.lower())
+            if description is not None:
+                param_info["description"] = description
 
     def _build_form_field_schema(
         self, param_name: str, param: inspect.Parameter
@@ -573,11 +615,16 @@ class ParameterProcessor:
     ) -> list[dict]:
         """Convert Pydantic model fields to query parameters"""
         parameters = []
-        model_schema = model_class.model_json_schema(mode="serialization")
+        model_schema = self._query_model_schema_cache.get(model_class)
+        if model_schema is None:
+            model_schema = model_class.model_json_schema(mode="serialization")
+            self._query_model_schema_cache[model_class] = model_schema
         required_fields = model_schema.get("required", [])
         properties = model_schema.get("properties", {})
 
-        for prop_name, prop_schema in properties.items():
+        for prop_name, cached_schema in properties.items():
+            # Each route gets its own copy of the cached property schema
+            prop_schema = copy.deepcopy(cached_schema)
             param_info = {
                 "name": prop_name,
                 "in": "query",
@@ -600,10 +647,7 @@ class ParameterProcessor:
 
         return parameters
 
-    @staticmethod
-    def _is_pydantic_model(annotation) -> bool:
-        """Check if annotation is a Pydantic model"""
-        return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+    _is_pydantic_model = staticmethod(_is_model_class)
 
 
 class ResponseBuilder:
@@ -614,8 +658,6 @@ class ResponseBuilder:
 
     def build_responses(self, route, has_security: bool = False) -> dict:
         """Build responses section with enhanced error handling"""
-        from http import HTTPStatus
-
         status_code = str(route.meta.get("status_code", 200))
         responses = {status_code: {"description": HTTPStatus(int(status_code)).phrase}}
 
@@ -674,8 +716,6 @@ class ResponseBuilder:
 
     def _add_custom_error_responses(self, responses: dict, route) -> None:
         """Add custom error responses"""
-        from http import HTTPStatus
-
         custom_errors = route.meta.get("response_errors")
         custom_responses = route.meta.get("responses")
 
@@ -693,15 +733,16 @@ class ResponseBuilder:
         if custom_responses:
             for status_code, response_info in custom_responses.items():
                 str_code = str(status_code)
-                model = None
+                is_model = False
                 if isinstance(response_info, dict):
                     description = response_info.get(
                         "description", HTTPStatus(int(status_code)).phrase
                     )
                     model = response_info.get("model")
+                    is_model = self._is_pydantic_model(model)
                     schema = (
                         self.schema_builder.get_model_schema(model)
-                        if model and self._is_pydantic_model(model)
+                        if is_model
                         else {"$ref": "#/components/schemas/ErrorSchema"}
                     )
                 else:
@@ -710,7 +751,7 @@ class ResponseBuilder:
 
                 if str_code in responses:
                     responses[str_code]["description"] = description
-                    if model and self._is_pydantic_model(model):
+                    if is_model:
                         responses[str_code]["content"] = {
                             "application/json": {"schema": schema}
                         }
@@ -720,10 +761,7 @@ class ResponseBuilder:
                         "content": {"application/json": {"schema": schema}},
                     }
 
-    @staticmethod
-    def _is_pydantic_model(annotation) -> bool:
-        """Check if annotation is a Pydantic model"""
-        return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+    _is_pydantic_model = staticmethod(_is_model_class)
 
 
 class OpenAPIGenerator:
@@ -788,24 +826,23 @@ class OpenAPIGenerator:
         if hasattr(self.router, "_global_security") and self.router._global_security:
             schema["security"] = self.router._global_security
 
-    @lru_cache(maxsize=128)
     def _convert_path(self, path: str) -> str:
         """Convert path format to OpenAPI format with caching"""
-        return PATH_PARAM_PATTERN.sub(r"{\1}", path)
+        return _openapi_path(path)
 
     def _has_security_dependency(self, route) -> bool:
         """Check if route has Security dependencies"""
-        sig = inspect.signature(route.endpoint)
-        for param in sig.parameters.values():
+        params = self.parameter_processor.get_signature_parameters(route.endpoint)
+        for param in params.values():
             if isinstance(param.default, Security):
                 return True
         return False
 
     def _extract_security_scopes(self, route) -> list[str]:
         """Extract scopes from Security dependencies"""
-        sig = inspect.signature(route.endpoint)
+        params = self.parameter_processor.get_signature_parameters(route.endpoint)
         all_scopes = []
-        for param in sig.parameters.values():
+        for param in params.values():
             if isinstance(param.default, Security):
                 all_scopes.extend(param.default.scopes)
         return list(set(all_scopes))  # Remove duplicates
@@ -815,9 +852,8 @@ class OpenAPIGenerator:
         parameters, request_body = self.parameter_processor.process_route_parameters(
             route
         )
-        has_security = bool(
-            route.meta.get("security")
-        ) or self._has_security_dependency(route)
+        has_security_dependency = self._has_security_dependency(route)
+        has_security = bool(route.meta.get("security")) or has_security_dependency
         responses = self.response_builder.build_responses(route, has_security)
 
         operation = {
@@ -834,7 +870,7 @@ class OpenAPIGenerator:
         # Auto-add security
         if (
             not operation.get("security")
-            and self._has_security_dependency(route)
+            and has_security_dependency
             and hasattr(self.router, "_security_schemes")
             and self.router._security_schemes
         ):
@@ -1,6 +1,6 @@
 import inspect
 import typing
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from types import MappingProxyType
 from typing import Any
 
@@ -50,10 +50,11 @@ class ParameterResolver:
     @classmethod
     def _get_signature(cls, endpoint) -> MappingProxyType[str, inspect.Parameter]:
         """Get cached signature parameters for endpoint"""
-        if endpoint not in cls._signature_cache:
-            sig = inspect.signature(endpoint)
-            cls._signature_cache[endpoint] = sig.parameters
-        return cls._signature_cache[endpoint]
+        params = cls._signature_cache.get(endpoint)
+        if params is None:
+            params = inspect.signature(endpoint).parameters
+            cls._signature_cache[endpoint] = params
+        return params
 
     @classmethod
     def resolve(cls, endpoint: Callable, request_data: RequestData) -> dict[str, Any]:
@@ -65,18 +66,10 @@ class ParameterResolver:
         # Resolve dependencies first
         kwargs.update(cls._resolve_dependencies(endpoint, request_data))
 
-        # Process regular parameters
-        regular_kwargs, model_fields, model_values = cls._process_parameters(
-            params, request_data, method=method
+        # Process and validate regular parameters
+        kwargs.update(
+            cls.resolve_parameters(endpoint, params, request_data, method=method)
         )
-        kwargs.update(regular_kwargs)
-
-        # Validate collected parameters
-        if model_fields:
-            validated_params = cls._validate_parameters(
-                endpoint, model_fields, model_values
-            )
-            kwargs.update(validated_params)
 
         return kwargs
 
@@ -92,17 +85,37 @@ class ParameterResolver:
         kwargs.update(await cls._resolve_dependencies_async(endpoint, request_data))
 
         # Sync parameters
+        kwargs.update(
+            cls.resolve_parameters(endpoint, params, request_data, method=method)
+        )
+
+        return kwargs
+
+    @classmethod
+    def resolve_parameters(
+        cls,
+        endpoint: Callable,
+        params: Mapping[str, inspect.Parameter],
+        request_data: RequestData,
+        method: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Resolve and validate the given non-dependency parameters
+
+        Used directly by the dependency resolver for dependency function
+        parameters; ``endpoint`` only names the cached validation model.
+        """
         regular_kwargs, model_fields, model_values = cls._process_parameters(
             params, request_data, method=method
         )
-        kwargs.update(regular_kwargs)
 
+        # Validate collected parameters
         if model_fields:
-            kwargs.update(
+            regular_kwargs.update(
                 cls._validate_parameters(endpoint, model_fields, model_values)
             )
 
-        return kwargs
+        return regular_kwargs
 
     @staticmethod
     def _resolve_dependencies(
@@ -322,8 +335,9 @@ class ParameterResolver:
         headers: dict[str, str], header_name: str
     ) -> str | None:
         """Get header value in case-insensitive manner"""
+        target = header_name.lower()
         for key, value in headers.items():
-            if key.lower() == header_name.lower():
+            if key.lower() == target:
                 return value
         return None
 
@@ -521,18 +535,19 @@ class ParameterResolver:
         )
 
         # Get or create model
-        if cache_key not in cls._param_model_cache:
+        model = cls._param_model_cache.get(cache_key)
+        if model is None:
 
             class _ParamsBase(BaseModel):
                 model_config = ConfigDict(arbitrary_types_allowed=True)
 
-            cls._param_model_cache[cache_key] = create_model(
+            model = cls._param_model_cache[cache_key] = create_model(
                 "ParamsModel",
                 __base__=_ParamsBase,
                 **model_fields,
             )
 
-        return cls._param_model_cache[cache_key]
+        return model
 
     @classmethod
     def _validate_parameters(
@@ -51,12 +51,15 @@ class BaseAdapter(BaseRouter, ABC):
     @classmethod
     def _get_type_adapter(cls, resp_model):
         """Get or create cached TypeAdapter"""
-        if resp_model not in cls._type_adapter_cache:
+        adapter = cls._type_adapter_cache.get(resp_model)
+        if adapter is None:
             with cls._cache_lock:
                 # Double-check locking
-                if resp_model not in cls._type_adapter_cache:
-                    cls._type_adapter_cache[resp_model] = TypeAdapter(resp_model)
-        return cls._type_adapter_cache[resp_model]
+                adapter = cls._type_adapter_cache.get(resp_model)
+                if adapter is None:
+                    adapter = TypeAdapter(resp_model)
+                    cls._type_adapter_cache[resp_model] = adapter
+        return adapter
 
     @classmethod
     def _validate_response(cls, result, response_model):
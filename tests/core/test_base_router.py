@@ -2,7 +2,11 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from fastopenapi.core.constants import SUPPORTED_METHODS
+from fastopenapi.core.dependency_resolver import dependency_resolver
+from fastopenapi.core.params import Depends
 from fastopenapi.core.router import BaseRouter, RouteInfo
+from fastopenapi.errors.exceptions import CircularDependencyError
 
 
 class TestBaseRouter:
@@ -66,6 +70,55 @@ class TestBaseRouter:
             self.router.add_route("/test", "TEST", test_endpoint)
             assert "Unsupported method: TEST" in str(excinfo.value)
 
+    def test_route_info_shares_canonical_method(self):
+        # Test route methods are normalized to the shared constant strings
+        def test_endpoint():
+            pass
+
+        route = RouteInfo("/test", "get", test_endpoint, {})
+        assert route.method == "GET"
+        assert route.method is SUPPORTED_METHODS[SUPPORTED_METHODS.index("GET")]
+
+    def test_add_route_compiles_dependency_plan(self):
+        # Test the dependency plan is compiled when the route is registered
+        def get_db():
+            return "db"
+
+        def test_endpoint(db: str = Depends(get_db)):
+            pass
+
+        self.router.add_route("/test", "GET", test_endpoint)
+
+        plan = dependency_resolver._plan_cache[test_endpoint]
+        assert [node.name for node in plan] == ["db"]
+
+    def test_add_route_defers_plan_errors(self):
+        # Test endpoints whose plan can't be compiled still register
+        def test_endpoint(db=Depends()):
+            pass
+
+        self.router.add_route("/test", "GET", test_endpoint)
+
+        assert len(self.router._routes) == 1
+        assert test_endpoint not in dependency_resolver._plan_cache
+
+    def test_add_route_rejects_circular_dependencies(self):
+        # Test a dependency cycle fails registration instead of every request
+        marker = Depends()
+
+        def dep_self(value: str = marker):
+            return value
+
+        marker.dependency = dep_self
+
+        def test_endpoint(value: str = Depends(dep_self)):
+            pass
+
+        with pytest.raises(CircularDependencyError):
+            self.router.add_route("/test", "GET", test_endpoint)
+
+        assert self.router._routes == []
+
     def test_get_routes(self):
         # Test getting all routes
         def test_endpoint():
@@ -101,6 +154,18 @@ class TestBaseRouter:
         assert len(self.router._routes) == 2
         assert self.router._routes[1].path == "/other"
 
+    def test_include_router_prefix_slashes(self):
+        # Test prefix and route slashes are joined with a single separator
+        def test_endpoint():
+            pass
+
+        other_router = BaseRouter()
+        other_router.add_route("/a", "GET", test_endpoint)
+        other_router.add_route("b", "GET", test_endpoint)
+
+        self.router.include_router(other_router, prefix="/api/")
+        assert [r.path for r in self.router._routes] == ["/api/a", "/api/b"]
+
     def test_include_router_merges_security_schemes(self):
         """Test that include_router merges security schemes from sub-router"""
         other_router = BaseRouter(security_scheme=None)
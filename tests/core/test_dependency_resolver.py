@@ -1,12 +1,17 @@
+import contextvars
+import dataclasses
+import functools
+import gc
 import threading
 import time
 from unittest.mock import patch
-from weakref import WeakKeyDictionary
 
 import pytest
 
 from fastopenapi.core.dependency_resolver import (
+    _MISSING,
     DependencyResolver,
+    _RequestState,
     get_dependency_stats,
     resolve_dependencies,
 )
@@ -36,8 +41,8 @@ class TestDependencyResolver:
     def test_init(self):
         """Test DependencyResolver initialization"""
         resolver = DependencyResolver()
-        assert isinstance(resolver._request_cache, WeakKeyDictionary)
-        assert resolver._signature_cache == {}
+        assert resolver._request_cache == {}
+        assert len(resolver._signature_cache) == 0
 
     def test_resolve_dependencies_simple(self):
         """Test resolving simple dependency"""
@@ -58,9 +63,14 @@ class TestDependencyResolver:
         def endpoint(param: str):
             return f"endpoint_{param}"
 
-        result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+        with patch.object(
+            self.resolver, "_resolve_endpoint_dependencies"
+        ) as mock_resolve:
+            result = self.resolver.resolve_dependencies(endpoint, self.request_data)
 
         assert result == {}
+        mock_resolve.assert_not_called()
+        assert len(self.resolver._request_cache) == 0
 
     def test_resolve_dependencies_without_caching(self):
         """Test dependency without caching"""
@@ -149,38 +159,46 @@ class TestDependencyResolver:
 
     def test_circular_dependency_detection(self):
         """Test circular dependency detection"""
+        b_marker = Depends()
 
-        def dep_a(b_dep: str = None):
-            if b_dep is None:
-                pass
-            return f"a_{b_dep or 'default'}"
+        def dep_a(b: str = b_marker):
+            return f"a_{b}"
 
-        original_resolve = self.resolver._resolve_single_dependency
+        def dep_b(a: str = Depends(dep_a)):
+            return f"b_{a}"
 
-        def mock_resolve(
-            dependency, request_data, param_name=None, param_annotation=None
-        ):
-            if dependency.dependency.__name__ == "dep_a":
-                request_cache = self.resolver._get_request_cache(request_data)
-                request_cache["resolving"].add(dependency.dependency)
-                return original_resolve(
-                    dependency, request_data, param_name, param_annotation
-                )
-            return original_resolve(
-                dependency, request_data, param_name, param_annotation
-            )
+        # Close the cycle: dep_a -> dep_b -> dep_a
+        b_marker.dependency = dep_b
 
-        with patch.object(
-            self.resolver, "_resolve_single_dependency", side_effect=mock_resolve
+        def endpoint(a: str = Depends(dep_a)):
+            return a
+
+        with pytest.raises(
+            CircularDependencyError,
+            match="Circular dependency detected for 'a': dep_a -> dep_b -> dep_a",
         ):
+            self.resolver.resolve_dependencies(endpoint, self.request_data)
 
-            def endpoint(a: str = Depends(dep_a)):
-                return a
+    def test_circular_dependency_detected_at_compile_time(self):
+        """Test cycles are rejected by compile_plan without running anything"""
+        called = []
+        marker = Depends()
 
-            with pytest.raises(
-                CircularDependencyError, match="Circular dependency detected"
-            ):
-                self.resolver.resolve_dependencies(endpoint, self.request_data)
+        def dep_self(value: str = marker):
+            called.append(value)
+            return value
+
+        marker.dependency = dep_self
+
+        def endpoint(value: str = Depends(dep_self)):
+            return value
+
+        with pytest.raises(CircularDependencyError, match="dep_self -> dep_self"):
+            self.resolver.compile_plan(endpoint)
+
+        assert called == []
+        assert endpoint not in self.resolver._plan_cache
+        assert dep_self not in self.resolver._plan_cache
 
     def test_nested_dependencies(self):
         """Test nested dependencies resolution"""
@@ -236,6 +254,41 @@ class TestDependencyResolver:
         with pytest.raises(DependencyError, match="No dependency function specified"):
             self.resolver.resolve_dependencies(endpoint, self.request_data)
 
+    def test_unhashable_callable_dependency_rejected(self):
+        """Test unhashable callable instances raise DependencyError"""
+
+        @dataclasses.dataclass
+        class Provider:
+            value: str = "v"
+
+            def __call__(self):
+                return self.value  # pragma: no cover
+
+        def endpoint(v: str = Depends(Provider())):
+            return v  # pragma: no cover
+
+        with pytest.raises(DependencyError, match="parameter 'v' must be hashable"):
+            self.resolver.resolve_dependencies(endpoint, self.request_data)
+        assert endpoint not in self.resolver._plan_cache
+
+    def test_hashable_callable_instance_dependency(self):
+        """Test hashable callable instances resolve and are cached per request"""
+
+        @dataclasses.dataclass(frozen=True)
+        class Provider:
+            value: str = "v"
+
+            def __call__(self):
+                return self.value
+
+        provider = Provider()
+
+        def endpoint(a: str = Depends(provider), b: str = Depends(provider)):
+            return a  # pragma: no cover
+
+        result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+        assert result == {"a": "v", "b": "v"}
+
     def test_dependency_with_type_annotation_as_function(self):
         """Test using type annotation as dependency function"""
 
@@ -262,16 +315,36 @@ class TestDependencyResolver:
         def endpoint(main: str = Depends(main_dep)):
             return main
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.return_value = {"regular_param": "resolved_value"}
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.return_value = {
+                "regular_param": "resolved_value"
+            }
 
             result = self.resolver.resolve_dependencies(endpoint, self.request_data)
 
             # The actual result will depend on the mocked ParameterResolver
             assert "main" in result
 
+    def test_resolve_sub_dependencies_regular_params_no_temp_functions(self):
+        """Test regular dependency params resolve without per-call temp functions"""
+        from fastopenapi.resolution.resolver import ParameterResolver
+
+        def main_dep(page: int = 1):
+            return page
+
+        def endpoint(main: int = Depends(main_dep)):
+            return main
+
+        self.resolver.resolve_dependencies(endpoint, self.request_data)
+        signatures = len(ParameterResolver._signature_cache)
+        plans = len(self.resolver._plan_cache)
+
+        result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+
+        assert result == {"main": 1}
+        assert len(ParameterResolver._signature_cache) == signatures
+        assert len(self.resolver._plan_cache) == plans
+
     def test_resolve_sub_dependencies_parameter_resolver_failure(self):
         """Test handling ParameterResolver failure in sub-dependencies"""
 
@@ -281,10 +354,8 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_required_param)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = Exception("Resolver failed")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = Exception("Resolver failed")
 
             with pytest.raises(
                 DependencyError, match="Failed to resolve required parameter"
@@ -301,10 +372,8 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_param)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = ValidationError("Bad param")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = ValidationError("Bad param")
 
             with pytest.raises(ValidationError, match="Bad param"):
                 self.resolver.resolve_dependencies(endpoint, self.request_data)
@@ -318,14 +387,19 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_defaults)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = Exception("Resolver failed")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = Exception("Resolver failed")
 
             result = self.resolver.resolve_dependencies(endpoint, self.request_data)
             assert result == {"dep": "default1_42"}
 
+    def test_get_parameter_resolver(self):
+        """Test ParameterResolver is imported once and cached on the class"""
+        from fastopenapi.resolution.resolver import ParameterResolver
+
+        assert DependencyResolver._get_parameter_resolver() is ParameterResolver
+        assert DependencyResolver._parameter_resolver is ParameterResolver
+
     def test_signature_caching(self):
         """Test function signature caching"""
 
@@ -341,6 +415,124 @@ class TestDependencyResolver:
         assert sig1 is sig2
         assert test_func in self.resolver._signature_cache
 
+    def test_compile_plan_caching(self):
+        """Test endpoint dependency plan is compiled once and cached"""
+
+        def dep():
+            return "dep"
+
+        def endpoint(regular: str, a: str = Depends(dep), b: str = Security(dep)):
+            return a
+
+        plan1 = self.resolver.compile_plan(endpoint)
+        plan2 = self.resolver.compile_plan(endpoint)
+
+        assert plan1 is plan2
+        assert [node.name for node in plan1] == ["a", "b"]
+        assert all(node.func is dep for node in plan1)
+        assert isinstance(plan1[1].dependency, Security)
+        # Security scopes are built at compile time, not per request
+        assert plan1[0].security_scopes is None
+        assert plan1[1].security_scopes is plan1[1].dependency.security_scopes
+
+    def test_compile_plan_for_sub_dependencies(self):
+        """Test dependency functions get their own cached plan"""
+
+        def leaf():
+            return "leaf"
+
+        def branch(scopes: SecurityScopes, value: str = Depends(leaf)):
+            return value
+
+        def endpoint(b: str = Depends(branch)):
+            return b
+
+        result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+
+        assert result == {"b": "leaf"}
+        branch_plan = self.resolver._plan_cache[branch]
+        assert [node.name for node in branch_plan] == ["value"]
+        # Leaf dependencies are called directly and never need a plan
+        assert branch_plan[0].is_leaf
+        assert not self.resolver.compile_plan(endpoint)[0].is_leaf
+        assert leaf not in self.resolver._plan_cache
+
+    def test_compile_plan_records_call_kind(self):
+        """Test each node records how its dependency function is called"""
+        from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR
+
+        def plain():
+            return "plain"
+
+        async def coroutine():
+            return "coroutine"
+
+        def generator():
+            yield "generator"
+
+        async def async_generator():
+            yield "async_generator"
+
+        def endpoint(
+            a=Depends(plain),
+            b=Depends(coroutine),
+            c=Depends(generator),
+            d=Depends(async_generator),
+        ):
+            return a
+
+        plan = self.resolver.compile_plan(endpoint)
+
+        assert [node.kind for node in plan] == [
+            0,
+            CO_COROUTINE,
+            CO_GENERATOR,
+            CO_ASYNC_GENERATOR,
+        ]
+
+    def test_classify_params_caches_split(self):
+        """Test dependency params are split once and reused across calls"""
+
+        def leaf():
+            return "leaf"
+
+        def dep(scopes: SecurityScopes, page: int = 1, value: str = Depends(leaf)):
+            return value
+
+        def endpoint(d: str = Depends(dep)):
+            return d
+
+        node = self.resolver.compile_plan(endpoint)[0]
+        injected1, regular1 = self.resolver._classify_params(node)
+        injected2, regular2 = self.resolver._classify_params(node)
+
+        assert self.resolver._params_cache[dep] == (("scopes",), regular1)
+        assert list(regular1) == ["page"]
+        assert regular1 is regular2
+        # Injected values are returned in a fresh dict every call
+        assert list(injected1) == ["scopes"]
+        assert injected1 is not injected2
+        assert isinstance(injected1["scopes"], SecurityScopes)
+
+    def test_leaf_dependency_fast_path(self):
+        """Test parameterless dependencies skip sub-dependency resolution"""
+        call_count = 0
+
+        def leaf():
+            nonlocal call_count
+            call_count += 1
+            return "leaf"
+
+        def endpoint(a: str = Depends(leaf), b: str = Depends(leaf)):
+            return a
+
+        with patch.object(self.resolver, "_resolve_sub_dependencies") as mock_sub:
+            result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+
+        assert result == {"a": "leaf", "b": "leaf"}
+        assert call_count == 1
+        mock_sub.assert_not_called()
+
     def test_request_cache_cleanup(self):
         """Test request cache cleanup after resolution"""
 
@@ -358,18 +550,16 @@ class TestDependencyResolver:
         final_cache_count = len(self.resolver._request_cache)
         assert final_cache_count == initial_cache_count
 
-    def test_cache_key_generation(self):
-        """Test cache key generation"""
+    def test_cache_keyed_by_function(self):
+        """Test resolved values are keyed by the dependency function itself"""
 
-        def test_func():
+        def test_dep():
             return "test"
 
-        key1 = self.resolver._make_cache_key(test_func, self.request_data)
-        key2 = self.resolver._make_cache_key(test_func, self.request_data)
+        state = _RequestState()
+        self.resolver._cache_result(test_dep, "test", state)
 
-        assert key1 == key2
-        assert isinstance(key1, tuple)
-        assert len(key1) == 2
+        assert state.resolved == {test_dep: "test"}
 
     def test_thread_safety_basic(self):
         """Test basic thread safety of cache operations"""
@@ -476,51 +666,68 @@ class TestDependencyResolver:
         result = resolve_dependencies(endpoint, self.request_data)
         assert result == {"dep": "global_test"}
 
-    def test_resolving_guard_context_manager(self):
-        """Test _resolving_guard context manager behavior"""
+    def test_cache_result_storage(self):
+        """Test _cache_result method"""
 
         def test_func():
             return "test"
 
-        request_cache = {"resolving": set()}
+        result = "test_result"
+        state = _RequestState()
 
-        # Test normal operation
-        with self.resolver._resolving_guard(request_cache, test_func, "test_param"):
-            assert test_func in request_cache["resolving"]
+        # Test with caching enabled
+        self.resolver._cache_result(test_func, result, state)
 
-        # Function should be removed after context
-        assert test_func not in request_cache["resolving"]
+        assert state.resolved[test_func] == result
 
-    def test_cache_result_storage(self):
-        """Test _cache_result method"""
-        cache_key = ("test", "key")
-        result = "test_result"
-        request_cache = {"resolved": {}}
+    def test_cache_result_keeps_first_value(self):
+        """Test _cache_result doesn't overwrite a value stored concurrently"""
 
-        # Test with caching enabled
-        self.resolver._cache_result(cache_key, result, request_cache)
+        def test_func():
+            return "test"
+
+        state = _RequestState(resolved={test_func: "first"})
+
+        value = self.resolver._cache_result(test_func, "second", state)
 
-        assert request_cache["resolved"][cache_key] == result
+        assert value == "first"
+        assert state.resolved[test_func] == "first"
 
     def test_try_get_cached_request_scope(self):
         """Test _try_get_cached with request-scoped cache hit"""
-        cache_key = ("test", "key")
+
+        def test_func():
+            return "test"
+
         expected_result = "cached_value"
-        request_cache = {"resolved": {cache_key: expected_result}}
+        state = _RequestState(resolved={test_func: expected_result})
 
-        hit, value = self.resolver._try_get_cached(cache_key, request_cache)
+        value = self.resolver._try_get_cached(test_func, state)
 
-        assert hit is True
         assert value == expected_result
 
     def test_try_get_cached_no_hit(self):
         """Test _try_get_cached with no cache hit"""
-        cache_key = ("test", "key")
-        request_cache = {"resolved": {}}
 
-        hit, value = self.resolver._try_get_cached(cache_key, request_cache)
+        def test_func():
+            return "test"
+
+        state = _RequestState()
+
+        value = self.resolver._try_get_cached(test_func, state)
+
+        assert value is _MISSING
+
+    def test_try_get_cached_none_value(self):
+        """Test _try_get_cached distinguishes cached None from a miss"""
+
+        def test_func():
+            return None
+
+        state = _RequestState(resolved={test_func: None})
+
+        value = self.resolver._try_get_cached(test_func, state)
 
-        assert hit is False
         assert value is None
 
     def test_cache_hit_without_lock(self):
@@ -552,16 +759,12 @@ class TestDependencyResolver:
 
         # Initialize request cache
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[new_request] = {
-                "resolved": {},
-                "resolving": set(),
-            }
+            self.resolver._request_cache[id(new_request)] = _RequestState()
 
         # Pre-populate cache
-        cache_key = self.resolver._make_cache_key(test_dep, new_request)
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[new_request]["resolved"][
-                cache_key
+            self.resolver._request_cache[id(new_request)].resolved[
+                test_dep
             ] = "cached_value"
 
         # Second call with new request - should hit cache without calling function
@@ -594,10 +797,7 @@ class TestDependencyResolver:
 
         # Initialize but don't resolve yet
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[request1] = {
-                "resolved": {},
-                "resolving": set(),
-            }
+            self.resolver._request_cache[id(request1)] = _RequestState()
 
         # Check active requests increased
         stats = self.resolver.get_cache_stats()
@@ -613,10 +813,7 @@ class TestDependencyResolver:
         )
 
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[request2] = {
-                "resolved": {},
-                "resolving": set(),
-            }
+            self.resolver._request_cache[id(request2)] = _RequestState()
 
         # Check active requests increased
         stats = self.resolver.get_cache_stats()
@@ -631,10 +828,10 @@ class TestDependencyResolver:
 
         # Clean up
         with self.resolver._request_cache_lock:
-            if request1 in self.resolver._request_cache:
-                del self.resolver._request_cache[request1]
-            if request2 in self.resolver._request_cache:
-                del self.resolver._request_cache[request2]
+            if id(request1) in self.resolver._request_cache:
+                del self.resolver._request_cache[id(request1)]
+            if id(request2) in self.resolver._request_cache:
+                del self.resolver._request_cache[id(request2)]
 
     def test_get_cache_stats_empty(self):
         """Test get_cache_stats with no active requests"""
@@ -710,6 +907,53 @@ class TestDependencyResolver:
         # Should have created at least 3 new locks (one per dependency function)
         assert final_locks >= initial_locks + 3
 
+    def test_caches_released_with_function(self):
+        """Test per-function caches don't outlive their dependency functions"""
+
+        def make_endpoint():
+            def dep():
+                return "dep"
+
+            def endpoint(d: str = Depends(dep)):
+                return d
+
+            return endpoint
+
+        endpoint = make_endpoint()
+        self.resolver.resolve_dependencies(endpoint, self.request_data)
+        assert len(self.resolver._execution_locks) == 1
+        assert len(self.resolver._plan_cache) == 1
+        assert len(self.resolver._signature_cache) == 2
+
+        # Drop the only strong reference to the endpoint and its dependency
+        del endpoint
+        gc.collect()
+
+        assert len(self.resolver._execution_locks) == 0
+        assert len(self.resolver._plan_cache) == 0
+        assert len(self.resolver._signature_cache) == 0
+
+    def test_caches_for_non_weakrefable_dependency(self):
+        """Test callables that can't be weakly referenced are still cached"""
+
+        class SlottedDependency:
+            __slots__ = ()
+
+            def __call__(self):
+                return "slotted"
+
+        dependency = SlottedDependency()
+
+        def endpoint(d: str = Depends(dependency)):
+            return d
+
+        result = self.resolver.resolve_dependencies(endpoint, self.request_data)
+
+        assert result == {"d": "slotted"}
+        assert dependency in self.resolver._execution_locks
+        assert dependency in self.resolver._signature_cache
+        assert self.resolver.compile_plan(endpoint)[0].is_leaf
+
     def test_request_cache_hit_performance(self):
         """Test that cache hit prevents function re-execution within same request"""
         execution_log = []
@@ -934,40 +1178,23 @@ class TestDependencyResolver:
     @pytest.mark.asyncio
     async def test_circular_dependency_detection_async(self):
         """Async version of test_circular_dependency_detection"""
+        b_marker = Depends()
 
-        async def dep_a(b_dep: str = None):
-            if b_dep is None:
-                pass
-            return f"a_{b_dep or 'default'}"
+        async def dep_a(b: str = b_marker):
+            return f"a_{b}"
 
-        original_resolve = self.resolver._resolve_single_dependency_async
+        async def dep_b(a: str = Depends(dep_a)):
+            return f"b_{a}"
 
-        async def mock_resolve(
-            dependency, request_data, param_name=None, param_annotation=None
-        ):
-            if dependency.dependency.__name__ == "dep_a":
-                request_cache = self.resolver._get_request_cache(request_data)
-                request_cache["resolving"].add(dependency.dependency)
-                return await original_resolve(
-                    dependency, request_data, param_name, param_annotation
-                )
-            return await original_resolve(
-                dependency, request_data, param_name, param_annotation
-            )
-
-        with patch.object(
-            self.resolver, "_resolve_single_dependency_async", side_effect=mock_resolve
-        ):
+        b_marker.dependency = dep_b
 
-            def endpoint(a: str = Depends(dep_a)):
-                return a
+        def endpoint(a: str = Depends(dep_a)):
+            return a
 
-            with pytest.raises(
-                CircularDependencyError, match="Circular dependency detected"
-            ):
-                await self.resolver.resolve_dependencies_async(
-                    endpoint, self.request_data
-                )
+        with pytest.raises(
+            CircularDependencyError, match="Circular dependency detected"
+        ):
+            await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
 
     @pytest.mark.asyncio
     async def test_nested_dependencies_async(self):
@@ -1028,6 +1255,21 @@ class TestDependencyResolver:
         with pytest.raises(DependencyError, match="No dependency function specified"):
             await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
 
+    @pytest.mark.asyncio
+    async def test_unhashable_callable_dependency_rejected_async(self):
+        """Async version of test_unhashable_callable_dependency_rejected"""
+
+        @dataclasses.dataclass
+        class Provider:
+            async def __call__(self):
+                return "v"  # pragma: no cover
+
+        def endpoint(v: str = Depends(Provider())):
+            return v  # pragma: no cover
+
+        with pytest.raises(DependencyError, match="parameter 'v' must be hashable"):
+            await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
+
     @pytest.mark.asyncio
     async def test_dependency_with_type_annotation_as_function_async(self):
         """Async version of test_dependency_with_type_annotation_as_function"""
@@ -1058,10 +1300,10 @@ class TestDependencyResolver:
         def endpoint(main: str = Depends(main_dep)):
             return main
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.return_value = {"regular_param": "resolved_value"}
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.return_value = {
+                "regular_param": "resolved_value"
+            }
             result = await self.resolver.resolve_dependencies_async(
                 endpoint, self.request_data
             )
@@ -1077,10 +1319,8 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_required_param)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = Exception("Resolver failed")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = Exception("Resolver failed")
             with pytest.raises(
                 DependencyError, match="Failed to resolve required parameter"
             ):
@@ -1099,10 +1339,8 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_param)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = ValidationError("Bad param")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = ValidationError("Bad param")
 
             with pytest.raises(ValidationError, match="Bad param"):
                 await self.resolver.resolve_dependencies_async(
@@ -1119,10 +1357,8 @@ class TestDependencyResolver:
         def endpoint(dep: str = Depends(dep_with_defaults)):
             return dep
 
-        with patch(
-            "fastopenapi.resolution.resolver.ParameterResolver"
-        ) as mock_resolver:
-            mock_resolver.resolve.side_effect = Exception("Resolver failed")
+        with patch.object(DependencyResolver, "_parameter_resolver") as mock_resolver:
+            mock_resolver.resolve_parameters.side_effect = Exception("Resolver failed")
             result = await self.resolver.resolve_dependencies_async(
                 endpoint, self.request_data
             )
@@ -1166,6 +1402,66 @@ class TestDependencyResolver:
         )
         assert result == {"d1": "dep1_result", "d2": "dep2_result", "d3": "dep3_result"}
 
+    @pytest.mark.asyncio
+    async def test_async_dependencies_run_in_declaration_order(self):
+        """Test async dependencies are awaited one by one in declaration order"""
+        calls = []
+
+        def sync_dep():
+            calls.append("sync")
+
+        async def first():
+            calls.append("first")
+
+        async def second():
+            calls.append("second")
+
+        def endpoint(
+            a=Depends(first), b=Depends(sync_dep), c=Depends(second)
+        ):  # pragma: no cover
+            pass
+
+        await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
+
+        assert calls == ["first", "sync", "second"]
+
+    @pytest.mark.asyncio
+    async def test_async_dependency_failure_stops_later_dependencies(self):
+        """Test dependencies after a failing one are not run"""
+        calls = []
+
+        async def deny():
+            raise ValueError("denied")
+
+        async def side_effect():
+            calls.append("side_effect")
+
+        def endpoint(auth=Depends(deny), other=Depends(side_effect)):
+            pass  # pragma: no cover
+
+        with pytest.raises(DependencyError):
+            await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_async_dependency_context_var_reaches_caller(self):
+        """Test ContextVar changes in async dependencies stay in the caller context"""
+        current_user = contextvars.ContextVar("current_user", default=None)
+
+        async def set_user():
+            current_user.set("alice")
+
+        async def other():
+            return None
+
+        def endpoint(a=Depends(set_user), b=Depends(other)):
+            pass  # pragma: no cover
+
+        await self.resolver.resolve_dependencies_async(endpoint, self.request_data)
+
+        assert current_user.get() == "alice"
+
     @pytest.mark.asyncio
     async def test_dependency_returning_none_async(self):
         """Async version of test_dependency_returning_none"""
@@ -1256,16 +1552,12 @@ class TestDependencyResolver:
 
         # Initialize request cache
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[new_request] = {
-                "resolved": {},
-                "resolving": set(),
-            }
+            self.resolver._request_cache[id(new_request)] = _RequestState()
 
         # Pre-populate cache
-        cache_key = self.resolver._make_cache_key(test_dep, new_request)
         with self.resolver._request_cache_lock:
-            self.resolver._request_cache[new_request]["resolved"][
-                cache_key
+            self.resolver._request_cache[id(new_request)].resolved[
+                test_dep
             ] = "cached_value"
 
         # Second call with new request - should hit cache without calling function
@@ -1411,6 +1703,21 @@ class TestDependencyResolver:
         )
         assert result == {"s": "sync", "a": "async"}
 
+    @pytest.mark.asyncio
+    async def test_partial_async_dependency(self):
+        """Test async dependency wrapped in functools.partial is awaited"""
+
+        async def async_dep(prefix):
+            return f"{prefix}_async"
+
+        def endpoint(a: str = Depends(functools.partial(async_dep, "partial"))):
+            return a
+
+        result = await self.resolver.resolve_dependencies_async(
+            endpoint, self.request_data
+        )
+        assert result == {"a": "partial_async"}
+
     @pytest.mark.asyncio
     async def test_async_cleanup_when_cache_already_deleted(self):
         """Test finally cleanup when request_data already removed from cache"""
@@ -1424,13 +1731,13 @@ class TestDependencyResolver:
         # Mock _resolve_endpoint_dependencies_async to delete cache during execution
         original_resolve = self.resolver._resolve_endpoint_dependencies_async
 
-        async def mock_resolve(endpoint, request_data):
-            result = await original_resolve(endpoint, request_data)
+        async def mock_resolve(endpoint, request_data, state):
+            result = await original_resolve(endpoint, request_data, state)
 
             # Delete cache BEFORE finally block runs
             with self.resolver._request_cache_lock:
-                if request_data in self.resolver._request_cache:
-                    del self.resolver._request_cache[request_data]
+                if id(request_data) in self.resolver._request_cache:
+                    del self.resolver._request_cache[id(request_data)]
 
             return result
 
@@ -1447,7 +1754,7 @@ class TestDependencyResolver:
             assert result == {"dep": "result"}
 
             # Verify cache is not present
-            assert self.request_data not in self.resolver._request_cache
+            assert id(self.request_data) not in self.resolver._request_cache
 
     # ==========================================
     # GENERATOR (YIELD) DEPENDENCY TESTS
@@ -14,6 +14,7 @@ from fastopenapi.core.params import (
     Path,
     Query,
     Security,
+    SecurityScopes,
 )
 
 
@@ -80,6 +81,26 @@ class TestParam:
 
         assert param.default is None
 
+    def test_param_forwards_only_set_options(self):
+        """Test that only non-None options reach FieldInfo"""
+        param = Param("value", ge=1, custom=None, other="x")
+
+        assert param._attributes_set == {"default": "value", "other": "x"}
+        assert any(getattr(m, "ge", None) == 1 for m in param.metadata)
+
+    def test_param_in_source_is_class_attribute(self):
+        """Test in_ is a class attribute, defaulting to query for bare Param"""
+        param = Param()
+        assert param.in_ == ParameterSource.QUERY
+        assert "in_" not in vars(param)
+        assert Path.in_ == ParameterSource.PATH
+
+    def test_param_examples_passed_to_field_info(self):
+        """Test examples go through FieldInfo rather than being set afterwards"""
+        param = Param(examples=["a"])
+        assert param.examples == ["a"]
+        assert param._attributes_set["examples"] == ["a"]
+
     def test_param_repr(self):
         """Test Param string representation"""
         param = Param("default_value")
@@ -354,6 +375,20 @@ class TestFile:
         assert file.description == "File to upload"
         assert file.examples == ["file1.txt", "file2.pdf"]
 
+    def test_file_media_type_default_is_class_level(self):
+        """Test default media types come from the class, overrides per instance"""
+        assert "media_type" not in vars(File())
+        assert File(media_type="image/png").media_type == "image/png"
+        assert File.media_type == "multipart/form-data"
+
+    def test_file_accepts_embed(self):
+        """Test File sets Body attributes without relaying through Form"""
+        file = File(embed=True, max_length=10)
+
+        assert file.embed is True
+        assert file.media_type == "multipart/form-data"
+        assert any(getattr(m, "max_length", None) == 10 for m in file.metadata)
+
 
 class TestDepends:
     """Test Depends class"""
@@ -407,7 +442,7 @@ class TestSecurity:
         """Test Security initialization with minimal parameters"""
         security = Security()
         assert security.dependency is None
-        assert security.scopes == []
+        assert security.scopes == ()
 
     def test_security_init_with_function(self):
         """Test Security with dependency function"""
@@ -417,7 +452,7 @@ class TestSecurity:
 
         security = Security(auth_dependency)
         assert security.dependency is auth_dependency
-        assert security.scopes == []
+        assert security.scopes == ()
 
     def test_security_init_with_scopes(self):
         """Test Security with scopes"""
@@ -428,7 +463,7 @@ class TestSecurity:
         scopes = ["read", "write", "admin"]
         security = Security(auth_dependency, scopes=scopes)
         assert security.dependency is auth_dependency
-        assert security.scopes == scopes
+        assert security.scopes == tuple(scopes)
 
     def test_security_init_full(self):
         """Test Security with all parameters"""
@@ -439,18 +474,32 @@ class TestSecurity:
         scopes = ["read", "write"]
         security = Security(auth_dependency, scopes=scopes)
         assert security.dependency is auth_dependency
-        assert security.scopes == scopes
+        assert security.scopes == tuple(scopes)
 
-    def test_security_scopes_none_to_empty_list(self):
-        """Test Security converts None scopes to empty list"""
+    def test_security_scopes_none_to_empty_tuple(self):
+        """Test Security converts None scopes to empty tuple"""
         security = Security(scopes=None)
-        assert security.scopes == []
+        assert security.scopes == ()
 
-    def test_security_scopes_tuple_to_list(self):
-        """Test Security converts tuple scopes to list"""
-        scopes = ("read", "write", "admin")
+    def test_security_scopes_list_to_tuple(self):
+        """Test Security stores list scopes as a tuple"""
+        scopes = ["read", "write", "admin"]
         security = Security(scopes=scopes)
-        assert security.scopes == ["read", "write", "admin"]
+        assert security.scopes == ("read", "write", "admin")
+
+    def test_security_prebuilds_security_scopes(self):
+        """Test Security builds its SecurityScopes once at init"""
+        security = Security(scopes=["read", "write"])
+        assert isinstance(security.security_scopes, SecurityScopes)
+        assert security.security_scopes.scopes == ["read", "write"]
+        assert security.security_scopes.scopes is not security.scopes
+
+    def test_markers_are_slotted(self):
+        """Test Depends and Security don't carry an instance __dict__"""
+        assert not hasattr(Depends(), "__dict__")
+        assert not hasattr(Security(), "__dict__")
+        with pytest.raises(AttributeError):
+            Security().extra = True
 
 
 class TestFieldInfoIntegration:
@@ -196,6 +196,10 @@ class TestResponse:
         r3 = Response(content=[1, 2, 3])
         assert r3.content == [1, 2, 3]
 
+    def test_slots(self):
+        """Test Response instances have no __dict__"""
+        assert not hasattr(Response(content=None), "__dict__")
+
 
 class TestRequestData:
 
@@ -272,3 +276,26 @@ class TestRequestData:
         assert request_data.cookies == {}
         assert request_data.form_data == {}
         assert request_data.files == {}
+
+    def test_slots(self):
+        """Test RequestData instances have no __dict__"""
+        assert not hasattr(RequestData(), "__dict__")
+
+    def test_absent_sections_share_read_only_mapping(self):
+        """Test sections passed as None reuse one immutable mapping"""
+        first = RequestData()
+        second = RequestData(path_params=None)
+
+        assert first.path_params is second.path_params
+        assert first.files is first.cookies
+        with pytest.raises(TypeError):
+            first.query_params["key"] = "value"
+
+    def test_explicit_empty_sections_are_kept(self):
+        """Test an explicitly passed empty dict is not replaced"""
+        query_params = {}
+        request_data = RequestData(query_params=query_params)
+
+        assert request_data.query_params is query_params
+        request_data.query_params["key"] = "value"
+        assert query_params == {"key": "value"}
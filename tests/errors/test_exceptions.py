@@ -0,0 +1,85 @@
+from http import HTTPStatus
+
+from fastopenapi.errors import (
+    APIError,
+    BadRequestError,
+    ErrorType,
+    ResourceNotFoundError,
+    ServiceUnavailableError,
+)
+
+
+class TestAPIErrorFromException:
+    """Test converting foreign exceptions to APIError"""
+
+    def test_api_error_returned_as_is(self):
+        """Test APIError instances pass through unchanged"""
+        error = ResourceNotFoundError()
+        assert APIError.from_exception(error) is error
+
+    def test_plain_exception(self):
+        """Test a plain exception becomes an internal server error"""
+        error = APIError.from_exception(RuntimeError("boom"))
+
+        assert error.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert error.error_type == ErrorType.INTERNAL_SERVER_ERROR
+        assert error.message == "boom"
+
+    def test_status_and_message_attributes(self):
+        """Test status and message are read from the first matching attribute"""
+
+        class HTTPException(Exception):
+            code = 404
+            reason = "Not here"
+            detail = "ignored"
+
+        error = APIError.from_exception(HTTPException("fallback"))
+
+        assert error.status_code == HTTPStatus.NOT_FOUND
+        assert error.error_type == ErrorType.RESOURCE_NOT_FOUND
+        assert error.message == "Not here"
+
+    def test_mapper(self):
+        """Test mapped exception types are converted with their message"""
+        error = APIError.from_exception(
+            KeyError("item"), {KeyError: ResourceNotFoundError}
+        )
+
+        assert isinstance(error, ResourceNotFoundError)
+        assert error.message == "'item'"
+
+    def test_empty_mapper(self):
+        """Test an empty or missing mapper falls back to attribute probing"""
+        for mapper in (None, {}):
+            error = APIError.from_exception(KeyError("item"), mapper)
+            assert error.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+    def test_mapper_matches_subclasses(self):
+        """Test the nearest mapped base class of the exception is used"""
+
+        class DatabaseError(Exception):
+            pass
+
+        class DatabaseTimeoutError(DatabaseError):
+            pass
+
+        mapper = {
+            Exception: BadRequestError,
+            DatabaseError: ServiceUnavailableError,
+        }
+        error = APIError.from_exception(DatabaseTimeoutError("slow"), mapper)
+
+        assert isinstance(error, ServiceUnavailableError)
+        assert error.message == "slow"
+
+    def test_invalid_status_falls_through(self):
+        """Test unknown status codes are skipped in favor of the next attribute"""
+
+        class FrameworkError(Exception):
+            status_code = 999
+            code = "409"
+
+        error = APIError.from_exception(FrameworkError("conflict"))
+
+        assert error.status_code is HTTPStatus.CONFLICT
+        assert error.error_type == ErrorType.RESOURCE_CONFLICT
@@ -1,7 +1,7 @@
 import inspect
 import threading
 from typing import Any, Optional, Union
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from pydantic import BaseModel, Field
 
@@ -397,6 +397,21 @@ class TestOpenAPIGenerator:
         assert schema["type"] == "integer"
         assert schema["nullable"] is True
 
+    def test_schema_builder_pep604_union_type(self):
+        """Test SchemaBuilder handles X | None unions"""
+        builder = SchemaBuilder({}, self.generator._cache_lock)
+
+        schema = builder.build_parameter_schema(float | None)
+        assert schema == {"type": "number", "nullable": True}
+
+    def test_schema_builder_returns_fresh_dicts(self):
+        """Test SchemaBuilder does not share schema dicts between calls"""
+        builder = SchemaBuilder({}, self.generator._cache_lock)
+
+        first = builder.build_parameter_schema(int)
+        first["minimum"] = 1
+        assert builder.build_parameter_schema(int) == {"type": "integer"}
+
     def test_parameter_with_default_value(self):
         """Test parameter with serializable default value"""
 
@@ -761,6 +776,19 @@ class TestOpenAPIGenerator:
         assert schema == {"$ref": "#/components/schemas/SimpleModel"}
         assert "SimpleModel" in definitions
 
+    def test_schema_builder_get_model_schema_hit_skips_lock(self):
+        """Test cache hits for registered models do not take the lock"""
+        lock = MagicMock()
+        builder = SchemaBuilder({}, lock)
+
+        builder.get_model_schema(SimpleModel)
+        assert lock.__enter__.call_count == 1
+
+        schema = builder.get_model_schema(SimpleModel)
+
+        assert schema == {"$ref": "#/components/schemas/SimpleModel"}
+        assert lock.__enter__.call_count == 1
+
     def test_schema_builder_cache_model_schema_with_definitions(self):
         """Test caching model schema with nested definitions"""
         builder = SchemaBuilder({}, threading.Lock())
@@ -815,6 +843,17 @@ class TestOpenAPIGenerator:
         assert "user_id" in path_params
         assert "post_id" in path_params
 
+    def test_parameter_processor_extract_path_parameters_openapi_style(self):
+        """Test extracting path parameters from an OpenAPI style path"""
+        processor = ParameterProcessor(self.generator.schema_builder)
+
+        path_params = processor._extract_path_parameters("/users/{user_id}/<slug>")
+
+        assert path_params == frozenset({"user_id", "slug"})
+        assert self.generator._convert_path("/users/<int:user_id>") == (
+            "/users/{user_id}"
+        )
+
     def test_parameter_processor_should_skip_parameter_depends(self):
         """Test skipping Depends parameters"""
         processor = ParameterProcessor(self.generator.schema_builder)
@@ -1212,6 +1251,26 @@ class TestOpenAPIGenerator:
         assert "name" in param_names
         assert "age" in param_names
 
+    def test_parameter_processor_query_model_schema_built_once(self):
+        """Test query model JSON schema is generated once per model"""
+        processor = ParameterProcessor(self.generator.schema_builder)
+
+        with patch.object(
+            SimpleModel,
+            "model_json_schema",
+            wraps=SimpleModel.model_json_schema,
+        ) as model_json_schema:
+            first = processor._build_query_params_from_model(SimpleModel)
+            second = processor._build_query_params_from_model(SimpleModel)
+
+        assert model_json_schema.call_count == 1
+        assert first == second
+        assert first[0] is not second[0]
+        assert first[0]["schema"] is not second[0]["schema"]
+
+        first[0]["schema"]["title"] = "Changed"
+        assert second[0]["schema"]["title"] != "Changed"
+
     def test_parameter_processor_is_pydantic_model_true(self):
         """Test Pydantic model detection - positive"""
         processor = ParameterProcessor(self.generator.schema_builder)
@@ -1461,6 +1520,24 @@ class TestOpenAPIGenerator:
 
         assert scopes == []
 
+    def test_openapi_generator_reuses_endpoint_signature(self):
+        """Test each endpoint signature is inspected once per generation"""
+
+        @self.router.get("/secure")
+        def secure_endpoint(
+            q: str = Query(None),
+            user: dict = Security(lambda: {}, scopes=["read"]),
+        ):
+            pass
+
+        with patch(
+            "fastopenapi.openapi.generator.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+            self.generator.generate()
+
+        assert signature.call_count == 1
+
     def test_openapi_generator_build_operation_with_security_auto_add(self):
         """Test auto-adding security to operation"""
 
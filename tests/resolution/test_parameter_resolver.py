@@ -1060,6 +1060,20 @@ class TestParameterResolver:
         assert result["age"] == 25
         assert isinstance(result["age"], int)
 
+    def test_resolve_parameters(self, request_data: RequestData) -> None:
+        """Test resolving a subset of parameters without an endpoint signature"""
+
+        def endpoint(page: int = Query(1), dep: str = Depends(lambda: "x")) -> None:
+            pass
+
+        params = dict(inspect.signature(endpoint).parameters)
+        del params["dep"]
+
+        result = ParameterResolver.resolve_parameters(endpoint, params, request_data)
+
+        assert result == {"page": 1}
+        assert endpoint not in ParameterResolver._signature_cache
+
     def test_validate_parameters_validation_error(self) -> None:
         """Test parameter validation error"""
 